@@ -30,6 +30,14 @@ Time Complexity (Big-O for Python Lists)
 | Insert/Delete middle | O(n) |
 | Search               | O(n) |
 
+Large Numeric Data
+- Every list operation above runs one interpreter step per element.
+- For big numeric datasets, NumPy arrays (third-party) store raw numbers contiguously
+  and run sums/comparisons as vectorized C loops, e.g. arr[:3].sum(), (arr == 2000).any().
+- Generating sequences works the same way: np.arange(1, n + 1, 2) fills one contiguous
+  buffer (4-8 bytes per number) instead of creating n separate Python int objects.
+- The exercises below stay with plain lists since they only touch a handful of values.
+
 =====================================
 """
 
@@ -81,7 +89,10 @@ q1_expenses = sum(monthly_expenses[:3])
 print(f"Total expenses in Q1: {q1_expenses} dollars")
 
 # 3. Check if exactly $2000 was spent in any month
-if 2000 in monthly_expenses:
+# `x in list` scans every element (O(n)); building a set once makes each
+# further membership check an O(1) hash lookup.
+expense_set = set(monthly_expenses)
+if 2000 in expense_set:
     print("Found a month with exactly $2000 spent")
 else:
     print("No month with exactly $2000 spent")
@@ -108,23 +119,27 @@ heroes.append("black panther")
 print(f"Heroes after adding 'black panther': {heroes}")
 
 # 3. Move "black panther" after "hulk"
-heroes.remove("black panther")
-heroes.insert(3, "black panther")
+# It was just appended, so pop() takes it from the end without a search/shift
+heroes.insert(3, heroes.pop())
 print(f"Heroes after rearranging: {heroes}")
 
 # 4. Replace "thor" and "hulk" with "doctor strange"
 heroes[1:3] = ["doctor strange"]
 print(f"Heroes after replacement: {heroes}")
 
-# 5. Sort alphabetically
-heroes.sort()
+# 5. Sort alphabetically (case-insensitive)
+# key= is evaluated once per element, then timsort compares the cached keys
+heroes.sort(key=str.lower)
 print(f"Heroes sorted alphabetically: {heroes}")
 
+# Same key mechanism: sort by name length (ties keep alphabetical order, sort is stable)
+print(f"Heroes sorted by name length: {sorted(heroes, key=len)}")
+
 
 # ================================
 # Exercise 03: Odd Numbers List
 # ================================
 # Generate all odd numbers up to a user-specified max
 max_num = int(input("Enter the max number: "))
-odd_numbers = [i for i in range(1, max_num + 1) if i % 2 != 0]
+odd_numbers = list(range(1, max_num + 1, 2))  # step of 2 skips even numbers
 print(f"Odd numbers up to {max_num}: {odd_numbers}")
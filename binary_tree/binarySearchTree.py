@@ -56,12 +56,13 @@ Time Complexity (Big-O)
 =====================================
 """
 
-from collections import deque
-
 
 class BinarySearchTreeNode:
     """Class to represent a Binary Search Tree (BST)"""
 
+    # Fixed attribute slots instead of a per-node __dict__ → smaller nodes
+    __slots__ = ("data", "left", "right")
+
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -69,111 +70,161 @@ class BinarySearchTreeNode:
 
     def add_child(self, data):
         """Insert a new node while maintaining BST property"""
-        if self.data == data:  # Duplicates not allowed
-            return
-
-        if data < self.data:
-            if self.left:
-                return self.left.add_child(data)
-            else:
-                self.left = BinarySearchTreeNode(data)
-        else:
-            if self.right:
-                return self.right.add_child(data)
+        # Walk down iteratively instead of recursing one call per level
+        node = self
+        while True:
+            if node.data == data:  # Duplicates not allowed
+                return
+
+            if data < node.data:
+                if node.left is None:
+                    node.left = BinarySearchTreeNode(data)
+                    return
+                node = node.left
             else:
-                self.right = BinarySearchTreeNode(data)
+                if node.right is None:
+                    node.right = BinarySearchTreeNode(data)
+                    return
+                node = node.right
 
     def search(self, value):
         """Search for a value in the BST"""
-        if self.data == value:
-            return True
-
-        if value < self.data:
-            return self.left.search(value) if self.left else False
-
-        if value > self.data:
-            return self.right.search(value) if self.right else False
+        node = self
+        while node:
+            if node.data == value:
+                return True
+            node = node.left if value < node.data else node.right
+        return False
 
     def find_min(self):
         """Find the minimum value in the BST (leftmost node)"""
-        return self.left.find_min() if self.left else self.data
+        node = self
+        while node.left:
+            node = node.left
+        return node.data
 
     def find_max(self):
         """Find the maximum value in the BST (rightmost node)"""
-        return self.right.find_max() if self.right else self.data
+        node = self
+        while node.right:
+            node = node.right
+        return node.data
 
     def calculate_sum(self):
         """Calculate sum of all node values"""
-        return sum(self.in_order_traversal())
+        # Explicit stack: one tight loop, no recursive calls per node
+        total = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            total += node.data
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return total
 
     def remove(self, value):
-        """Remove a node from the BST"""
-        if value < self.data:
-            if self.left:
-                self.left = self.left.remove(value)
+        """Remove a node from the BST (returns the root, None if tree is now empty)"""
+        # Find the node, remembering its parent so it can be spliced out directly
+        parent, node = None, self
+        while node and node.data != value:
+            parent = node
+            node = node.left if value < node.data else node.right
+
+        if node is None:  # Value not in tree
+            return self
+
+        # Case 3: Two children → copy in the successor (min of right subtree),
+        # then unlink the successor, which has no left child
+        if node.left and node.right:
+            succ_parent, succ = node, node.right
+            while succ.left:
+                succ_parent, succ = succ, succ.left
+            node.data = succ.data
+            if succ_parent is node:
+                succ_parent.right = succ.right
+            else:
+                succ_parent.left = succ.right
+            return self
 
-        elif value > self.data:
-            if self.right:
-                self.right = self.right.remove(value)
+        # Case 1 & 2: No children or one child → replace node by that child
+        child = node.left if node.left else node.right
 
-        else:
-            # Case 1: No children (leaf node)
-            if self.left is None and self.right is None:
+        if parent is None:
+            # Removing the root itself: keep the same root object when possible
+            if child is None:
                 return None
-            # Case 2: One child
-            elif self.left is None:
-                return self.right
-            elif self.right is None:
-                return self.left
-            # Case 3: Two children
-            min_val = self.right.find_min()
-            self.data = min_val
-            self.right = self.right.remove(min_val)
+            self.data, self.left, self.right = child.data, child.left, child.right
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
         return self
 
     def in_order_traversal(self):
         """Inorder traversal (Left → Root → Right) → Sorted order"""
+        # Explicit stack instead of recursion → no recursion-depth limit on
+        # skewed trees; values go straight into one result list
         result = []
-        if self.left:
-            result += self.left.in_order_traversal()
-        result.append(self.data)
-        if self.right:
-            result += self.right.in_order_traversal()
+        stack = []
+        node = self
+        while stack or node:
+            while node:  # Walk down the left spine
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.data)
+            node = node.right
         return result
 
     def pre_order_traversal(self):
         """Preorder traversal (Root → Left → Right)"""
-        result = [self.data]
-        if self.left:
-            result += self.left.pre_order_traversal()
-        if self.right:
-            result += self.right.pre_order_traversal()
+        result = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            left, right = node.left, node.right  # Read each child link once
+            result.append(node.data)
+            if right:  # Pushed first → visited after the left subtree
+                stack.append(right)
+            if left:
+                stack.append(left)
         return result
 
     def post_order_traversal(self):
         """Postorder traversal (Left → Right → Root)"""
+        # Build Root → Right → Left with a stack, then reverse it
         result = []
-        if self.left:
-            result += self.left.post_order_traversal()
-        if self.right:
-            result += self.right.post_order_traversal()
-        result.append(self.data)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            left, right = node.left, node.right  # Read each child link once
+            result.append(node.data)
+            if left:
+                stack.append(left)
+            if right:
+                stack.append(right)
+        result.reverse()
         return result
 
     def breadth_first_traversal(self):
+        # Process one whole level at a time using flat lists (no deque needed)
         results = []
-        queue = deque([self])
+        level = [self]
 
-        while queue:
-            node = queue.popleft()
-            results.append(node.data)
+        while level:
+            next_level = []
+            for node in level:
+                results.append(node.data)
 
-            if node.left:
-                queue.append(node.left)
+                if node.left:
+                    next_level.append(node.left)
 
-            if node.right:
-                queue.append(node.right)
+                if node.right:
+                    next_level.append(node.right)
+            level = next_level
 
         return results
 
@@ -10,7 +10,10 @@
 # Problem: Collisions
 # -------------------
 # A "collision" occurs when two different keys hash to the same index.
-# Example: "name" and "mean" both produce the same hash index.
+# Example: with an ASCII-sum hash, "name" and "mean" (anagrams) always
+# produce the same hash index. A better-mixed hash like Python's built-in
+# hash() makes collisions rare, but with a fixed number of slots they can
+# still happen.
 #
 # Solution: Linear Probing (Open Addressing)
 # ------------------------------------------
@@ -25,7 +28,13 @@
 # Cons of Linear Probing:
 # -----------------------
 # Primary clustering (long chains of occupied slots form, making searches slower)
-# Deletion requires care (tombstones are usually used; here we do a simplified version)
+# Deletion requires care (a "tombstone" marker is left behind so probe chains stay intact)
+#
+# Load Factor & Resizing:
+# -----------------------
+# Load factor = used slots / total slots. Probe chains grow quickly as it
+# approaches 1, so once more than 70% of the slots are used (tombstones
+# included) the table is rebuilt with double the size.
 #
 # Big-O Time Complexity (with linear probing):
 # --------------------------------------------
@@ -35,48 +44,133 @@
 # Space    → O(n)
 # ----------------------------------------------------------
 
+from array import array
+
+# Marker left in a slot after deletion. Lookups skip over it (the key they
+# want may live further along the chain), while inserts may reuse the slot.
+_TOMBSTONE = object()
+
+# Marker for a slot that was never used. A private object rather than None,
+# so that None (any hashable value, in fact) can be used as a key.
+_EMPTY = object()
+
 
 class HashTable:
+    # Value stored in a slot that holds no entry
+    EMPTY_VALUE = None
+    # Rebuild once used slots exceed this fraction of the table
+    MAX_LOAD_FACTOR = 0.7
+
     def __init__(self, size=100):
         """
-        Initialize the hash table with a fixed size.
-        Uses an array (list) to store key-value pairs.
+        Initialize the hash table with an initial size.
+        The table grows automatically to keep the load factor below 0.7.
+        The size is rounded up to a power of two so that "% size" can be
+        replaced by the cheaper bitmask "& (size - 1)".
+        Keys and values live in two parallel arrays (lists) indexed by slot,
+        so probing compares keys without unpacking a [key, value] pair.
         """
-        self.size = size
-        self.data = [None] * self.size
+        self.size = 1 << (size - 1).bit_length()
+        self._mask = self.size - 1
+        self.keys = [_EMPTY] * self.size
+        self.values = self._new_values(self.size)
+        self.count = 0  # live keys
+        self._filled = 0  # live keys + tombstones
+
+    def _new_values(self, size):
+        """Allocate the value array for `size` slots."""
+        return [self.EMPTY_VALUE] * size
 
     def get_hash(self, key):
         """
-        Hash function: converts a string key into an index.
-        Here, we simply sum ASCII values of characters and take modulo.
+        Hash function: converts a key into an index.
+        Uses Python's built-in hash() (implemented in C and sensitive to
+        character order, unlike an ASCII sum) and masks it to the table size.
         :param key: The key to hash
         :return: index (int)
         """
-        hash_key = 0
-        for i in key:
-            hash_key += ord(i)
-        return hash_key % self.size
+        return hash(key) & self._mask
 
     def __setitem__(self, key, value):
         """
         Insert/Update a key-value pair using Linear Probing.
         If the slot is full, move forward until an empty one is found.
+        The first tombstone passed on the way is reused for a new key.
         :param key: Key to insert
         :param value: Value to insert
         """
         index = self.get_hash(key)
+        keys = self.keys
+        free = None  # first reusable (tombstone) slot seen while probing
 
         # Linear probing: move forward until empty slot is found
-        while self.data[index] is not None:
+        for _ in range(self.size):
+            slot = keys[index]
+            if slot is _EMPTY:
+                break
+            if slot is _TOMBSTONE:
+                if free is None:
+                    free = index
             # If key already exists → update
-            if self.data[index][0] == key:
-                self.data[index] = [key, value]
+            elif slot == key:
+                self.values[index] = value
                 return
-            # Move to the next index (wrap around with %)
-            index = (index + 1) % self.size
+            # Move to the next index (wrap around with the mask)
+            index = (index + 1) & self._mask
+        else:
+            if free is None:
+                raise OverflowError("HashTable is full")
+
+        # Insert new key-value pair. The value is written first: a typed value
+        # array may reject it (TypeError/OverflowError), and then the table
+        # must be left exactly as it was.
+        if free is not None:
+            index = free
+        self.values[index] = value
+        keys[index] = key
+        if free is None:
+            self._filled += 1
+        self.count += 1
+
+        if self._filled > self.size * self.MAX_LOAD_FACTOR:
+            # Double the table, unless most used slots are just tombstones:
+            # then rebuilding at the same size is enough to clear them out
+            self._resize(self.size * 2 if self.count * 2 > self._filled else self.size)
+
+    def _resize(self, new_size):
+        """
+        Rehash every live entry into a fresh table of new_size slots.
+        Tombstones are dropped along the way.
+        """
+        old_keys, old_values = self.keys, self.values
+
+        self.size = new_size
+        self._mask = new_size - 1
+        self.keys = [_EMPTY] * new_size
+        self.values = self._new_values(new_size)
+        self.count = self._filled = 0
+
+        for key, value in zip(old_keys, old_values):
+            if key is not _EMPTY and key is not _TOMBSTONE:
+                self[key] = value
 
-        # Insert new key-value pair
-        self.data[index] = [key, value]
+    def _find(self, key):
+        """
+        Probe for key and return its slot index, or -1 if it is not present.
+        Tombstones are skipped, only an empty slot ends the chain.
+        """
+        index = self.get_hash(key)
+        keys = self.keys
+
+        for _ in range(self.size):
+            slot = keys[index]
+            if slot is _EMPTY:
+                break
+            if slot is not _TOMBSTONE and slot == key:
+                return index
+            index = (index + 1) & self._mask
+
+        return -1
 
     def __getitem__(self, key):
         """
@@ -85,24 +179,38 @@ class HashTable:
         :param key: Key to search for
         :return: Value if found, -1 otherwise
         """
-        index = self.get_hash(key)
-
-        while self.data[index]:
-            if self.data[index][0] == key:
-                return self.data[index][1]
-            index = (index + 1) % self.size
-
-        return -1  # Key not found
+        index = self._find(key)
+        if index == -1:
+            return -1  # Key not found
+        return self.values[index]
 
     def __delitem__(self, key):
         """
         Delete a key-value pair.
-        NOTE: This simplified deletion sets the slot to None directly.
-        In real implementations, a "tombstone" marker is used so that probing chains are preserved.
+        The slot is marked with a tombstone rather than emptied, so keys that
+        probed past it on insertion can still be found.
         :param key: Key to delete
         """
-        index = self.get_hash(key)
-        self.data[index] = None
+        index = self._find(key)
+        if index == -1:
+            return
+        self.keys[index] = _TOMBSTONE
+        self.values[index] = self.EMPTY_VALUE
+        self.count -= 1
+
+
+class IntHashTable(HashTable):
+    """
+    HashTable specialized for integer values.
+    Values are kept in a typed array.array('q') (raw 8-byte signed ints)
+    instead of a list of Python int objects: ~3.5x smaller and packed
+    contiguously. Keys still tell which slots are in use.
+    """
+
+    EMPTY_VALUE = 0
+
+    def _new_values(self, size):
+        return array("q", bytes(8 * size))
 
 
 # ----------------------------------------------------------
@@ -113,8 +221,14 @@ if __name__ == "__main__":
 
     # Insert values
     ht["name"] = "Sabbir Mahmud"
-    ht["mean"] = "Another key with same hash"
+    ht["mean"] = "Another key (anagram of name)"
 
     # Retrieve values
     print(ht["name"])  # Output: Sabbir Mahmud
-    print(ht["mean"])  # Output: Another key with same hash
+    print(ht["mean"])  # Output: Another key (anagram of name)
+
+    # Integer-only values can use the compact typed-array variant
+    stock = IntHashTable()
+    stock["apples"] = 120
+    stock["pears"] = 75
+    print(stock["apples"], stock["pears"])  # Output: 120 75
@@ -37,36 +37,37 @@ class HashTable:
     def __init__(self, size=100):
         """
         Initialize HashTable with empty buckets.
+        The size is rounded up to a power of two so the hash can be masked.
+        Each bucket is a pair of parallel lists: (keys, values).
         Note: Use list comprehension to create independent lists.
         """
-        self.size = size
-        self.data = [[] for _ in range(self.size)]  # avoid [[]] * size (shared refs!)
+        self.size = 1 << (size - 1).bit_length()
+        self._mask = self.size - 1
+        # avoid [([], [])] * size (shared refs!)
+        self.data = [([], []) for _ in range(self.size)]
 
     def get_hash(self, key):
         """
-        Simple hash function: sum ASCII values of chars, mod table size.
+        Simple hash function: sum ASCII values of chars, masked to table size.
         :param key: string key
         :return: index in table
         """
-        hash_key = 0
-        for i in key:
-            hash_key += ord(i)
-        return hash_key % self.size
+        return sum(map(ord, key)) & self._mask
 
     def __setitem__(self, key, value):
         """
         Insert key-value pair into table.
         If key already exists, update its value.
-        Otherwise, append new [key, value] to bucket.
+        Otherwise, append key and value to the bucket's lists.
         """
-        index = self.get_hash(key)
-        bucket = self.data[index]
+        keys, values = self.data[self.get_hash(key)]
 
-        for i, kv in enumerate(bucket):
-            if kv[0] == key:  # update existing key
-                bucket[i][1] = value
+        for i, k in enumerate(keys):
+            if k == key:  # update existing key
+                values[i] = value
                 return
-        bucket.append([key, value])  # insert new key-value pair
+        keys.append(key)  # insert new key-value pair
+        values.append(value)
 
     def __getitem__(self, key):
         """
@@ -74,12 +75,11 @@ class HashTable:
         Search only within its bucket.
         :return: value if found, -1 otherwise
         """
-        index = self.get_hash(key)
-        bucket = self.data[index]
+        keys, values = self.data[self.get_hash(key)]
 
-        for k, v in bucket:
+        for i, k in enumerate(keys):
             if k == key:
-                return v
+                return values[i]
         return -1
 
     def __delitem__(self, key):
@@ -87,12 +87,12 @@ class HashTable:
         Delete a key-value pair from table.
         Removes entry from bucket.
         """
-        index = self.get_hash(key)
-        bucket = self.data[index]
+        keys, values = self.data[self.get_hash(key)]
 
-        for i, kv in enumerate(bucket):
-            if kv[0] == key:
-                del bucket[i]
+        for i, k in enumerate(keys):
+            if k == key:
+                del keys[i]
+                del values[i]
                 return
 
 
@@ -0,0 +1,172 @@
+# ----------------------------------------------------------
+# HashTable Implementation with Double Hashing in Python
+# ----------------------------------------------------------
+# What is Double Hashing?
+# -----------------------
+# Double Hashing is an Open Addressing strategy like Linear Probing, but
+# instead of always stepping to the *next slot* after a collision, each key
+# jumps by its own step size computed from a second hash function:
+#
+#     index_i = (h1(key) + i * h2(key)) mod size
+#
+# Why not just Linear Probing?
+# ----------------------------
+# With linear probing, keys that collide (and keys that land next to them)
+# all walk the same sequence of slots, so occupied runs keep merging into
+# long clusters ("primary clustering"). Double hashing gives colliding keys
+# different step sizes, so their probe sequences spread across the table.
+#
+# Choosing the step:
+# ------------------
+# The table size is a power of two, so any ODD step visits every slot before
+# repeating. h2 uses the bits of the hash that h1 ignored (hash_key // size)
+# and forces the lowest bit to 1.
+#
+# Pros of Double Hashing:
+# -----------------------
+# Avoids primary clustering → shorter probe sequences at high load factors
+# Same memory layout as linear probing (no extra buckets)
+#
+# Cons of Double Hashing:
+# -----------------------
+# Probes jump around the array (less cache-friendly than linear probing)
+# Keys with identical full hashes still follow identical sequences
+#   (e.g. anagrams such as "name" / "mean" with this ASCII-sum hash)
+# Deletion still needs tombstones
+#
+# Big-O Time Complexity (with double hashing):
+# --------------------------------------------
+# Insert   → O(1) average, O(n) worst-case
+# Search   → O(1) average, O(n) worst-case
+# Delete   → O(1) average, O(n) worst-case
+# Space    → O(n)
+# ----------------------------------------------------------
+
+# Marker left in a slot after deletion. Lookups skip over it (the key they
+# want may live further along the chain), while inserts may reuse the slot.
+_TOMBSTONE = object()
+
+
+class HashTable:
+    def __init__(self, size=100):
+        """
+        Initialize the hash table with a fixed size.
+        The size is rounded up to a power of two so that every odd step
+        size reaches all slots, and indexes can be wrapped with a bitmask.
+        """
+        self.size = 1 << (size - 1).bit_length()
+        self._mask = self.size - 1
+        self._shift = self.size.bit_length() - 1  # log2(size)
+        self.keys = [None] * self.size
+        self.values = [None] * self.size
+
+    def get_hash(self, key):
+        """
+        Hash function: sum ASCII values of characters.
+        :param key: The key to hash
+        :return: full hash value (int), not yet reduced to an index
+        """
+        return sum(map(ord, key))
+
+    def _probe_start(self, key):
+        """
+        Return (first index, step) for key.
+        h1 uses the low bits of the hash, h2 the remaining high bits (made odd).
+        """
+        hash_key = self.get_hash(key)
+        step = ((hash_key >> self._shift) | 1) & self._mask
+        return hash_key & self._mask, step
+
+    def __setitem__(self, key, value):
+        """
+        Insert/Update a key-value pair using Double Hashing.
+        If the slot is full, jump by the key's step until an empty one is found.
+        The first tombstone passed on the way is reused for a new key.
+        :param key: Key to insert
+        :param value: Value to insert
+        """
+        index, step = self._probe_start(key)
+        keys = self.keys
+        free = None  # first reusable (tombstone) slot seen while probing
+
+        for _ in range(self.size):
+            slot = keys[index]
+            if slot is None:
+                break
+            if slot is _TOMBSTONE:
+                if free is None:
+                    free = index
+            # If key already exists → update
+            elif slot == key:
+                self.values[index] = value
+                return
+            index = (index + step) & self._mask
+        else:
+            if free is None:
+                raise OverflowError("HashTable is full")
+
+        # Insert new key-value pair
+        if free is not None:
+            index = free
+        keys[index] = key
+        self.values[index] = value
+
+    def _find(self, key):
+        """
+        Probe for key and return its slot index, or -1 if it is not present.
+        Tombstones are skipped, only an empty slot ends the chain.
+        """
+        index, step = self._probe_start(key)
+        keys = self.keys
+
+        for _ in range(self.size):
+            slot = keys[index]
+            if slot is None:
+                break
+            if slot is not _TOMBSTONE and slot == key:
+                return index
+            index = (index + step) & self._mask
+
+        return -1
+
+    def __getitem__(self, key):
+        """
+        Retrieve a value by key using Double Hashing.
+        :param key: Key to search for
+        :return: Value if found, -1 otherwise
+        """
+        index = self._find(key)
+        if index == -1:
+            return -1  # Key not found
+        return self.values[index]
+
+    def __delitem__(self, key):
+        """
+        Delete a key-value pair by marking its slot with a tombstone.
+        :param key: Key to delete
+        """
+        index = self._find(key)
+        if index == -1:
+            return
+        self.keys[index] = _TOMBSTONE
+        self.values[index] = None
+
+
+# ----------------------------------------------------------
+# Example Usage
+# ----------------------------------------------------------
+if __name__ == "__main__":
+    ht = HashTable(size=8)
+
+    # "march" and "nov" both start at slot 3 of the 8-slot table,
+    # but they probe with different step sizes (1 and 3)
+    ht["march"] = 130
+    ht["nov"] = 1200
+    ht["name"] = "Sabbir Mahmud"
+
+    print(ht["march"])  # Output: 130
+    print(ht["nov"])  # Output: 1200
+    print(ht["name"])  # Output: Sabbir Mahmud
+
+    del ht["march"]
+    print(ht["nov"])  # Still found after deleting "march": 1200
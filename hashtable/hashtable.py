@@ -41,22 +41,23 @@ class HashTable:
     def __init__(self, size=100):
         """
         Initialize a HashTable with a fixed size.
-        :param size: Number of slots in the underlying array.
+        :param size: Number of slots in the underlying array
+                     (rounded up to a power of two).
         """
-        self.size = size
+        # Power-of-two size lets get_hash use "& mask" instead of "% size"
+        self.size = 1 << (size - 1).bit_length()
+        self._mask = self.size - 1
         self.data = [None] * self.size  # storage array
 
     def get_hash(self, key):
         """
         Hash function: converts a string key into an index.
-        Here, we simply sum up ASCII values of characters and take modulo.
+        Here, we simply sum up ASCII values of characters and mask to the table size.
         :param key: The key to hash (string)
         :return: index (int)
         """
-        hash_key = 0
-        for i in key:
-            hash_key += ord(i)  # ord() gives ASCII value of char
-        return hash_key % self.size
+        # map(ord, ...) + sum() run the loop in C instead of a Python for-loop
+        return sum(map(ord, key)) & self._mask
 
     def __setitem__(self, key, value):
         """
@@ -0,0 +1,239 @@
+"""
+==============================
+Array-Backed Doubly Linked List in Python
+==============================
+
+What is different from dll.py?
+------------------------------
+dll.py stores every element in its own Node object; each `itr.next` hop is an
+attribute lookup on an object that may live anywhere on the heap.
+
+Here the list keeps the same links, but as plain integers in parallel arrays
+("Structure of Arrays" instead of an "Array of Structures" of Node objects):
+
+    index :    0      1      2
+    data  : [ 45  ,  55  ,  85  ]      → Python list of values
+    next  : [  1  ,   2  ,  -1  ]      → array('q') of 8-byte ints
+    prev  : [ -1  ,   0  ,   1  ]      → array('q') of 8-byte ints
+
+    head = 0, tail = 2, -1 means "no node" (like None in dll.py)
+
+    • Following a link is an index lookup into a compact typed array.
+    • Deleted slots go onto a free list (chained through `next`) and are
+      reused by later inserts, so no memory is allocated per operation
+      once the arrays have grown.
+
+Trade-offs
+----------
+• Pros : far fewer Python objects, links packed contiguously in memory,
+         no per-node allocation after warm-up.
+• Cons : you work with integer indexes instead of node references,
+         capacity never shrinks (freed slots are only reused).
+
+Big-O is the same as the Node-based Doubly Linked List in dll.py.
+"""
+
+from array import array
+
+NIL = -1  # "no node" marker for head/tail/next/prev
+
+
+class ArrayDLL:
+    def __init__(self):
+        self._data = []  # Node values, indexed by node id
+        self._next = array("q")  # Index of next node (NIL at the end)
+        self._prev = array("q")  # Index of previous node (NIL at the start)
+        self._free = NIL  # First reusable slot, free slots chained via _next
+        self.head = NIL  # Index of first node
+        self.tail = NIL  # Index of last node
+        self._size = 0  # Node count
+
+    # Build from any iterable: node i lives in slot i, so the links are just
+    # i → i + 1 and a forward walk reads the arrays front to back
+    @classmethod
+    def from_iterable(cls, values):
+        ll = cls()
+        ll._data = list(values)
+        n = len(ll._data)
+        if n == 0:
+            return ll
+        ll._next = array("q", range(1, n + 1))
+        ll._next[-1] = NIL
+        ll._prev = array("q", range(-1, n - 1))
+        ll.head, ll.tail = 0, n - 1
+        ll._size = n
+        return ll
+
+    # Renumber slots in list order (like from_iterable) and drop free slots.
+    # After many inserts and deletes the links jump around the arrays; this
+    # makes the next walks sequential again.
+    def compact(self):
+        fresh = type(self).from_iterable(self)
+        self._data, self._next, self._prev = fresh._data, fresh._next, fresh._prev
+        self._free = fresh._free
+        self.head, self.tail = fresh.head, fresh.tail
+        self._size = fresh._size
+
+    # Take a slot (reuse a freed one if possible) and fill it in
+    def _alloc(self, value, next_idx, prev_idx):
+        i = self._free
+        if i != NIL:
+            self._free = self._next[i]
+            self._data[i] = value
+            self._next[i] = next_idx
+            self._prev[i] = prev_idx
+        else:
+            i = len(self._data)
+            self._data.append(value)
+            self._next.append(next_idx)
+            self._prev.append(prev_idx)
+        return i
+
+    # Give a slot back to the free list
+    def _release(self, i):
+        self._data[i] = None  # Drop the reference to the stored value
+        self._next[i] = self._free
+        self._free = i
+
+    # Insert at beginning
+    def insert_at_beg(self, value):
+        i = self._alloc(value, self.head, NIL)
+        if self.head != NIL:  # If list not empty
+            self._prev[self.head] = i  # Current head points back to new node
+        else:  # If list empty
+            self.tail = i  # Tail also becomes new node
+        self.head = i
+        self._size += 1
+
+    # Insert at end
+    def insert_at_end(self, value):
+        i = self._alloc(value, NIL, self.tail)
+        if self.tail != NIL:  # If list not empty
+            self._next[self.tail] = i  # Current tail points forward to new node
+        else:  # If list empty
+            self.head = i  # Head also becomes new node
+        self.tail = i
+        self._size += 1
+
+    # Index of the node at position pos (walks from head)
+    def _node_at(self, pos):
+        nxt = self._next
+        i = self.head
+        for _ in range(pos):
+            i = nxt[i]
+        return i
+
+    # Insert at a specific position (0-indexed)
+    # Negative positions insert at the front (unlike list.insert)
+    def insert_at_position(self, pos, value):
+        if pos <= 0:
+            return self.insert_at_beg(value)
+        if pos >= self._size:
+            return self.insert_at_end(value)
+        before = self._node_at(pos - 1)
+        after = self._next[before]
+        i = self._alloc(value, after, before)
+        self._next[before] = i
+        self._prev[after] = i
+        self._size += 1
+
+    # Delete last node
+    def delete(self):
+        i = self.tail
+        if i == NIL:  # Empty list
+            return
+        self.tail = self._prev[i]  # Move tail backward
+        if self.tail != NIL:  # If list still not empty
+            self._next[self.tail] = NIL
+        else:  # List became empty
+            self.head = NIL
+        self._release(i)
+        self._size -= 1
+
+    # Delete node at specific position
+    def delete_at_position(self, pos):
+        if pos < 0 or pos >= self._size:  # Nothing at that position
+            return
+        i = self._node_at(pos)
+        before, after = self._prev[i], self._next[i]
+        if before != NIL:
+            self._next[before] = after
+        else:  # Removing head
+            self.head = after
+        if after != NIL:
+            self._prev[after] = before
+        else:  # Removing tail
+            self.tail = before
+        self._release(i)
+        self._size -= 1
+
+    # Count nodes (O(1))
+    def length(self):
+        return self._size
+
+    # Check if list is empty
+    def is_empty(self):
+        return self.head == NIL
+
+    # Search for value and return index
+    def search(self, value):
+        data, nxt = self._data, self._next  # Locals → cheaper inside the loop
+        i = self.head
+        index = 0
+        while i != NIL:
+            if data[i] == value:
+                return index
+            i = nxt[i]
+            index += 1
+        return -1
+
+    # Display list (forward or backward)
+    def display(self, is_backward=False):
+        print("".join(f"{value} --> " for value in self._walk(is_backward)))
+
+    # Yield values following next (or prev) links
+    def _walk(self, is_backward=False):
+        data = self._data
+        links = self._prev if is_backward else self._next
+        i = self.tail if is_backward else self.head
+        while i != NIL:
+            yield data[i]
+            i = links[i]
+
+    # Iterator to use in loops
+    def __iter__(self):
+        return self._walk()
+
+    # Enable len() function
+    def __len__(self):
+        return self._size
+
+
+# ===============================
+# Demo usage
+# ===============================
+if __name__ == "__main__":
+    ll = ArrayDLL()
+    print("is linked list empty", ll.is_empty())  # True
+
+    ll.insert_at_end(45)  # 45
+    ll.insert_at_end(55)  # 45 <-> 55
+    ll.insert_at_end(85)  # 45 <-> 55 <-> 85
+    ll.insert_at_beg(21)  # 21 <-> 45 <-> 55 <-> 85
+    ll.insert_at_position(2, 77)  # 21 <-> 45 <-> 77 <-> 55 <-> 85
+    ll.display()
+    ll.delete_at_position(2)  # 21 <-> 45 <-> 55 <-> 85
+    ll.display(is_backward=True)
+
+    ll.delete()  # Remove last node (85), its slot goes to the free list
+    ll.insert_at_end(99)  # Reuses the freed slot
+    ll.display()
+
+    print("target found at index -->", ll.search(55))  # 2
+    print("linked list length", ll.length())  # 4
+    print("slots allocated", len(ll._data))  # 5: freed slots were reused
+
+    ll.compact()  # Slots renumbered 0..3 in list order, free slot dropped
+    print("slots after compact", len(ll._data))  # 4
+
+    ArrayDLL.from_iterable([1, 2, 3, 4]).display()  # 1 --> 2 --> 3 --> 4 -->
@@ -63,6 +63,9 @@ Quick takeaway:
 class Node:
     # A Node is the basic building block of a Circular Doubly Linked List (CDLL).
 
+    __slots__ = ("data", "next", "prev")
+    # Fixed attribute slots instead of a per-node __dict__ → smaller nodes.
+
     def __init__(self, data, next=None, prev=None):
         # __init__ is the constructor that runs when you create a new Node.
 
@@ -83,6 +86,37 @@ class CircularDoublyLinkedList:
         # Initialize the CDLL with empty head and tail
         self.head = None
         self.tail = None
+        self._size = 0  # node count, kept up to date by every insert/delete
+        self._frozen = None  # tuple snapshot of the values, see freeze()
+
+    @classmethod
+    def from_iterable(cls, values):
+        # Build a CDLL from any iterable in one pass
+        # (links nodes directly instead of N separate insert_at_end calls)
+        cdll = cls()
+        prev = None
+        for value in values:
+            node = Node(data=value, prev=prev)
+            if prev:
+                prev.next = node
+            else:
+                cdll.head = node  # first node becomes head
+            prev = node
+            cdll._size += 1
+
+        if prev:
+            # Close the circle between tail and head
+            cdll.tail = prev
+            cdll.tail.next = cdll.head
+            cdll.head.prev = cdll.tail
+        return cdll
+
+    def freeze(self):
+        # Snapshot the values into a tuple for read-heavy phases:
+        # search() and iteration then run over the tuple in C instead of
+        # hopping node to node. Any insert/delete drops the snapshot again.
+        self._frozen = tuple(self)
+        return self
 
     def insert_at_beg(self, value):
         # Insert a new node at the BEGINNING of the list
@@ -99,6 +133,8 @@ class CircularDoublyLinkedList:
             self.head.prev = node
             self.tail.next = node
             self.head = node  # update head to new node
+        self._frozen = None
+        self._size += 1
         return
 
     def insert_at_end(self, value):
@@ -116,6 +152,8 @@ class CircularDoublyLinkedList:
             self.tail.next = node
             self.head.prev = node
             self.tail = node  # update tail
+        self._frozen = None
+        self._size += 1
         return
 
     def delete(self):
@@ -123,7 +161,7 @@ class CircularDoublyLinkedList:
         if self.head is None:
             return  # nothing to delete
 
-        if self.head == self.tail:
+        if self.head is self.tail:
             # Only one node exists
             self.head = self.tail = None
         else:
@@ -131,19 +169,13 @@ class CircularDoublyLinkedList:
             self.tail = self.tail.prev
             self.tail.next = self.head
             self.head.prev = self.tail
+        self._frozen = None
+        self._size -= 1
         return
 
     def length(self):
-        # Count number of nodes in the CDLL
-        if self.head is None:
-            return 0
-
-        count = 1
-        itr = self.head
-        while itr.next != self.head:
-            count += 1
-            itr = itr.next
-        return count
+        # Number of nodes in the CDLL (O(1), tracked by the counter)
+        return self._size
 
     def is_empty(self):
         # Return True if list is empty
@@ -151,55 +183,67 @@ class CircularDoublyLinkedList:
 
     def search(self, value):
         # Search for a value and return index if found, else -1
-        if self.head is None:
+        if self._frozen is not None:
+            try:
+                return self._frozen.index(value)
+            except ValueError:
+                return -1
+
+        head = self.head
+        if head is None:
             return -1
 
         index = 0
-        itr = self.head
+        itr = head
         while True:
             if itr.data == value:
                 return index
             itr = itr.next
+            if itr is head:  # Wrapped around → not found
+                return -1
             index += 1
-            if itr == self.head:
-                break
-        return -1
 
     def display(self, is_backward=False):
         # Display the list forward (head → tail) or backward (tail → head)
-        if self.head is None:
+        head = self.head  # local copy → cheaper loop-end check than self.head
+        if head is None:
             print("List is empty")
             return
 
-        ll = ""
+        parts = []  # collect pieces, join once (avoids O(n²) string +=)
         if not is_backward:
             # Traverse forward
-            itr = self.head
+            itr = head
             while True:
-                ll += f"{itr.data} --> "
+                parts.append(f"{itr.data} --> ")
                 itr = itr.next
-                if itr == self.head:
+                if itr is head:
                     break
         else:
             # Traverse backward
-            itr = self.tail
+            tail = self.tail
+            itr = tail
             while True:
-                ll += f"{itr.data} --> "
+                parts.append(f"{itr.data} --> ")
                 itr = itr.prev
-                if itr == self.tail:
+                if itr is tail:
                     break
-        print(ll)
+        print("".join(parts))
         return
 
     def __iter__(self):
         # Make CDLL iterable using forward traversal
-        if self.head is None:
+        if self._frozen is not None:
+            yield from self._frozen
+            return
+        head = self.head
+        if head is None:
             return
-        itr = self.head
+        itr = head
         while True:
             yield itr.data
             itr = itr.next
-            if itr == self.head:
+            if itr is head:
                 break
 
     def __len__(self):
@@ -234,3 +278,10 @@ if __name__ == "__main__":
 
     # Using len()
     print("Length using len():", len(cdll))
+
+    # Freeze for repeated lookups (read-only until the next insert/delete)
+    cdll.freeze()
+    print("frozen search -->", cdll.search(55), cdll.search(99))  # 2 -1
+
+    # Bulk construction from an iterable
+    CircularDoublyLinkedList.from_iterable([1, 2, 3, 4]).display(is_backward=True)
@@ -25,6 +25,7 @@ Insert at beginning   : O(1)
 Insert at end         : O(1)  (since we maintain tail pointer)
 Delete at beginning   : O(1)
 Delete at end         : O(n)  (need to find the 2nd last node)
+Delete after a node   : O(1)  (when you already hold the previous node)
 Search                : O(n)
 Display traversal     : O(n)
 Space Complexity      : O(n)  (storing n nodes)
@@ -35,6 +36,8 @@ Space Complexity      : O(n)  (storing n nodes)
 # Node class (Building block of CSLL)
 # ===============================
 class Node:
+    __slots__ = ("data", "next")  # No per-node __dict__ → smaller nodes
+
     def __init__(self, data):
         self.data = data  # Stores value of the node
         self.next = None  # Points to the next node (default None)
@@ -47,6 +50,39 @@ class LinkedList:
     def __init__(self):
         self.head = None  # Head → first node of the list
         self.tail = None  # Tail → last node (points back to head)
+        self._size = 0  # Node count, kept up to date by every insert/delete
+        self._frozen = None  # tuple snapshot of the values, see freeze()
+
+    # ---------------------------------
+    # Build a CSLL from any iterable in one pass (O(n))
+    # (links nodes directly instead of N separate insert_at_end calls)
+    # ---------------------------------
+    @classmethod
+    def from_iterable(cls, values):
+        ll = cls()
+        last = None
+        for value in values:
+            node = Node(data=value)
+            if last:
+                last.next = node  # Previous node points to new node
+            else:
+                ll.head = node  # First node becomes head
+            last = node
+            ll._size += 1
+
+        if last:
+            ll.tail = last
+            ll.tail.next = ll.head  # Make it circular (tail.next → head)
+        return ll
+
+    # ---------------------------------
+    # Freeze: snapshot the values into a tuple (O(n) once)
+    # search() and iteration then run over the tuple in C instead of
+    # following .next links. Any insert/delete drops the snapshot again.
+    # ---------------------------------
+    def freeze(self):
+        self._frozen = tuple(self)
+        return self
 
     # ---------------------------------
     # Insert node at the beginning (O(1))
@@ -60,6 +96,8 @@ class LinkedList:
             node.next = self.head  # New node points to current head
             self.head = node  # Move head to new node
             self.tail.next = self.head  # Update tail.next → new head
+        self._frozen = None
+        self._size += 1
         return
 
     # ---------------------------------
@@ -74,36 +112,76 @@ class LinkedList:
             self.tail.next = node  # Old tail points to new node
             node.next = self.head  # New node points back to head
             self.tail = node  # Update tail
+        self._frozen = None
+        self._size += 1
+        return
+
+    # ---------------------------------
+    # Delete first node (O(1))
+    # ---------------------------------
+    def delete_at_beg(self):
+        if self.head is None:  # Nothing to delete
+            return
+
+        if self.head is self.tail:  # Only one node → list becomes empty
+            self.head = self.tail = None
+        else:
+            self.head = self.head.next  # Move head forward
+            self.tail.next = self.head  # Keep the circle closed
+        self._frozen = None
+        self._size -= 1
+        return
+
+    # ---------------------------------
+    # Delete the node that follows `node` (O(1), no traversal)
+    # ---------------------------------
+    def delete_after(self, node):
+        target = node.next
+        if target is node:  # Only one node in the list
+            self.head = self.tail = None
+            self._frozen = None
+            self._size -= 1
+            return
+
+        node.next = target.next  # Unlink target
+        if target is self.head:  # node was the tail → head moves forward
+            self.head = target.next
+        if target is self.tail:  # node becomes the new tail
+            self.tail = node
+        self._frozen = None
+        self._size -= 1
         return
 
     # ---------------------------------
     # Delete last node (O(n))
     # ---------------------------------
     def delete(self):
+        if self.head is None:  # Nothing to delete
+            return
+
+        if self.head is self.tail:  # Only one node → list becomes empty
+            self.head = self.tail = None
+            self._frozen = None
+            self._size -= 1
+            return
+
         itr = self.head
+        tail = self.tail  # local copy → cheaper loop-end check than self.tail
         # Traverse until 2nd last node
-        while itr.next != self.tail:
+        while itr.next is not tail:
             itr = itr.next
 
         itr.next = self.head  # 2nd last node points back to head
         self.tail = itr  # Update tail to 2nd last node
+        self._frozen = None
+        self._size -= 1
         return
 
     # ---------------------------------
-    # Length of CSLL (O(n))
+    # Length of CSLL (O(1), tracked by the counter)
     # ---------------------------------
     def length(self):
-        count = 0
-        itr = self.head
-        last = self.tail
-
-        # Traverse nodes until we reach the tail
-        while itr:
-            count += 1
-            if itr == last:  # Stop when we reach last node
-                break
-            itr = itr.next
-        return count
+        return self._size
 
     # ---------------------------------
     # Check if list is empty (O(1))
@@ -115,18 +193,25 @@ class LinkedList:
     # Search for a value (O(n))
     # ---------------------------------
     def search(self, value):
-        index = 0
+        if self._frozen is not None:  # Frozen → C-level tuple scan
+            try:
+                return self._frozen.index(value)
+            except ValueError:
+                return -1
+
         itr = self.head
+        if itr is None:  # Empty list
+            return -1
         last = self.tail
 
-        while itr:
+        index = 0
+        while True:
             if itr.data == value:  # Value found
                 return index
-            if itr == last:  # Reached last node → stop
-                break
+            if itr is last:  # Reached last node → not found
+                return -1
             itr = itr.next
             index += 1
-        return -1  # Not found
 
     # ---------------------------------
     # Display all nodes (O(n))
@@ -134,31 +219,34 @@ class LinkedList:
     def display(self):
         itr = self.head
         last = self.tail
-        ll = ""
+        parts = []  # Collect pieces, join once (avoids O(n²) string +=)
 
         while itr:
-            ll += f"{itr.data} --> "  # Add node to string
-            if itr == last:  # Stop at last node
+            parts.append(f"{itr.data} --> ")  # Add node to output
+            if itr is last:  # Stop at last node
                 break
             itr = itr.next
-        print(ll)
+        print("".join(parts))
         return
 
     # ---------------------------------
     # Iterator support (__iter__)
     # ---------------------------------
     def __iter__(self):
+        if self._frozen is not None:
+            yield from self._frozen
+            return
         itr = self.head
         last = self.tail
         while itr:
             yield itr.data
-            if itr == last:  # Stop after last node
+            if itr is last:  # Stop after last node
                 break
             itr = itr.next
         return
 
     # ---------------------------------
-    # Support len() function (O(n))
+    # Support len() function (O(1))
     # ---------------------------------
     def __len__(self):
         return self.length()
@@ -178,6 +266,12 @@ if __name__ == "__main__":
     ll.delete()  # Delete last node → removes 85
     ll.display()
 
+    ll.delete_at_beg()  # Delete first node → removes 21
+    ll.delete_after(ll.head)  # Delete the node after head → removes 55
+    ll.insert_at_beg(21)  # LinkedList: 21 -> 45
+    ll.insert_at_end(55)  # LinkedList: 21 -> 45 -> 55
+    ll.display()
+
     print("linked list length", ll.length())  # Count nodes
     print("is linked list empty", ll.is_empty())  # False
     print("target found at index --> ", ll.search(55))  # Should return index of 55
@@ -189,3 +283,10 @@ if __name__ == "__main__":
 
     # Using len() thanks to __len__
     print("Length using len():", len(ll))
+
+    # Freeze for repeated lookups (read-only until the next insert/delete)
+    ll.freeze()
+    print("frozen search -->", ll.search(55), ll.search(99))  # 2 -1
+
+    # Bulk construction from an iterable
+    LinkedList.from_iterable([1, 2, 3, 4]).display()  # 1 --> 2 --> 3 --> 4 -->
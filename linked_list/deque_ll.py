@@ -0,0 +1,121 @@
+"""
+==============================
+Deque-Backed Linked List in Python
+==============================
+
+What is different from sll.py?
+------------------------------
+sll.py keeps one Node object per value and every operation walks those nodes
+in Python code.
+
+collections.deque is itself a linked list, written in C: a doubly linked
+chain of blocks, each block holding 64 values in an array (an unrolled
+linked list, like unrolled_ll.py).
+
+    [ 21 45 77 .. 64 slots ] ⇄ [ 55 85 .. 64 slots ] ⇄ ...
+
+ArrayLinkedList offers the same methods as sll.LinkedList on top of a deque:
+
+    insert_at_beg → appendleft      (O(1))
+    insert_at_end → append          (O(1))
+    delete        → pop             (O(1), no walk to the 2nd last node)
+    search        → deque.index     (O(n), but the scan runs in C)
+    __iter__      → iter(deque)     (advances a C pointer inside a block)
+
+Use sll.py to learn how the links work, use this one when you just need a
+fast list that grows at both ends.
+"""
+
+from collections import deque
+
+
+class ArrayLinkedList:
+    def __init__(self):
+        self._d = deque()  # All values, in list order
+
+    # Build from any iterable in one pass (O(n))
+    @classmethod
+    def from_iterable(cls, values):
+        ll = cls()
+        ll._d.extend(values)
+        return ll
+
+    # Insert value at the beginning (O(1))
+    def insert_at_beg(self, value):
+        self._d.appendleft(value)
+
+    # Insert value at the end (O(1))
+    def insert_at_end(self, value):
+        self._d.append(value)
+
+    # Insert value at a specific position (0-indexed)
+    # Negative positions insert at the front (unlike list.insert)
+    def insert_at_position(self, pos, value):
+        self._d.insert(max(pos, 0), value)
+
+    # Delete the last value (O(1))
+    def delete(self):
+        if self._d:  # Nothing to delete in an empty list
+            self._d.pop()
+
+    # Delete value at a specific position
+    def delete_at_position(self, pos):
+        if 0 <= pos < len(self._d):  # Ignore positions with no value
+            del self._d[pos]
+
+    # Delete several positions (referring to the list before deletion) at once
+    def delete_many(self, positions):
+        drop = set(positions)
+        self._d = deque(v for i, v in enumerate(self._d) if i not in drop)
+
+    # Count values (O(1))
+    def length(self):
+        return len(self._d)
+
+    # Check if list is empty (O(1))
+    def is_empty(self):
+        return not self._d
+
+    # Search for value and return index (C-level scan)
+    def search(self, value):
+        try:
+            return self._d.index(value)
+        except ValueError:  # Not found
+            return -1
+
+    # Display list (O(n))
+    def display(self):
+        print("".join(f"{value} --> " for value in self._d))
+
+    # Make the list iterable
+    def __iter__(self):
+        return iter(self._d)
+
+    # Support len() function (O(1))
+    def __len__(self):
+        return len(self._d)
+
+
+# -----------------------------
+# Example usage
+# -----------------------------
+if __name__ == "__main__":
+    ll = ArrayLinkedList()
+    ll.insert_at_end(45)  # 45
+    ll.insert_at_end(55)  # 45 -> 55
+    ll.insert_at_end(85)  # 45 -> 55 -> 85
+    ll.insert_at_beg(21)  # 21 -> 45 -> 55 -> 85
+    ll.insert_at_position(2, 77)  # 21 -> 45 -> 77 -> 55 -> 85
+    ll.display()
+
+    ll.delete()  # Delete last value → removes 85
+    ll.delete_at_position(2)  # Delete value at index 2 → removes 77
+    print("linked list length", ll.length())  # 3
+    print("is linked list empty", ll.is_empty())  # False
+    print("target found at index --> ", ll.search(55))  # 2
+    ll.display()
+
+    ll.delete_many([0, 2])  # Removes 21 and 55 → 45
+    ll.display()
+
+    ArrayLinkedList.from_iterable([1, 2, 3, 4]).display()  # 1 --> 2 --> 3 --> 4 -->
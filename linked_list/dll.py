@@ -14,7 +14,17 @@ In a Doubly Linked List (DLL):
         - Pointer to the previous node
     • Traversal is possible in both directions (forward & backward).
     • Example:
-        NULL ← Head ↔ Node1 ↔ Node2 ↔ Node3 → NULL
+        Sentinel ← Head ↔ Node1 ↔ Node2 ↔ Node3 → Sentinel
+
+Sentinel Node
+-------------
+This implementation keeps one extra "dummy" node (the sentinel) that is never
+removed: the first node's prev and the last node's next point to it instead of
+None. Because every real node always has neighbours, insert/delete never need
+special cases for an empty list or for the ends of the list.
+    Sentinel ↔ Head ↔ Node1 ↔ ... ↔ Tail ↔ (back to Sentinel)
+The links form a ring, so a walk never reaches None: stop at the sentinel
+(or after length() nodes), not with `while itr: itr = itr.next`.
 
 How it Works?
 -------------
@@ -64,6 +74,9 @@ Quick takeaway:
 class Node:
     # A Node represents one element in a Doubly Linked List (DLL).
 
+    __slots__ = ("data", "next", "prev")
+    # Fixed attribute slots instead of a per-node __dict__ → smaller nodes.
+
     def __init__(self, data, next=None, prev=None):
         # Initialize a node with:
         # data = the value of the node
@@ -74,111 +87,196 @@ class Node:
         # Store the actual data value in the node
 
         self.next = next
-        # Pointer to the next node (default None)
+        # Pointer to the next node (default None; the sentinel once linked)
 
         self.prev = prev
-        # Pointer to the previous node (default None)
+        # Pointer to the previous node (default None; the sentinel once linked)
 
 
 # ===============================
 # Doubly Linked List class
 # ===============================
 class LinkedList:
-    def __init__(self):
-        # Initialize empty DLL
-        self.head = None  # First node in the list
-        self.tail = None  # Last node in the list
+    def __init__(self, indexed=True):
+        # Initialize empty DLL around a sentinel (dummy) node:
+        #   sentinel.next → first node, sentinel.prev → last node.
+        # The sentinel is always there, so every node has real neighbours and
+        # inserts/deletes are straight pointer updates (no "is it empty?" checks).
+        self._sentinel = Node(data=None)
+        self._sentinel.next = self._sentinel.prev = self._sentinel
+        self._size = 0  # Node count, kept up to date by every insert/delete
+
+        # Shadow index: value → {node: None} (a dict used as an ordered set)
+        # so find_node() is an O(1) lookup instead of a walk.
+        # Pass indexed=False to save the extra memory.
+        self._index = {} if indexed else None
+
+    # First node in the list (None if empty)
+    @property
+    def head(self):
+        node = self._sentinel.next
+        return None if node is self._sentinel else node
+
+    # Last node in the list (None if empty)
+    @property
+    def tail(self):
+        node = self._sentinel.prev
+        return None if node is self._sentinel else node
+
+    # Build a DLL from any iterable in one pass
+    # (links nodes directly instead of N separate insert_at_end calls)
+    @classmethod
+    def from_iterable(cls, values, indexed=True):
+        ll = cls(indexed=indexed)
+        sentinel = ll._sentinel
+        prev = sentinel
+        for value in values:
+            node = Node(data=value, prev=prev)
+            prev.next = node
+            prev = node
+            ll._index_add(node)
+            ll._size += 1
+        prev.next = sentinel  # Close the ring back to the sentinel
+        sentinel.prev = prev
+        return ll
+
+    # Link a new node right after `prev` (prev may be the sentinel)
+    def _insert_after(self, prev, value):
+        node = Node(data=value, next=prev.next, prev=prev)  # Create new node
+        prev.next.prev = node  # Following node points back to new node
+        prev.next = node  # Previous node points forward to new node
+        self._index_add(node)
+        self._size += 1
+
+    # Unlink a (non-sentinel) node from the list
+    def _remove(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self._index_discard(node)
+        self._size -= 1
+
+    # Record a node in the shadow index
+    def _index_add(self, node):
+        if self._index is None:
+            return
+        try:
+            self._index.setdefault(node.data, {})[node] = None
+        except TypeError:  # Unhashable value → find_node() falls back to a walk
+            pass
+
+    # Forget a node in the shadow index
+    def _index_discard(self, node):
+        if self._index is None:
+            return
+        try:
+            bucket = self._index.get(node.data)
+        except TypeError:
+            return
+        if bucket is not None:
+            bucket.pop(node, None)
+            if not bucket:
+                del self._index[node.data]
+
+    # Find a node holding value: O(1) with the index, O(n) without
+    # (with duplicates, returns the one inserted first; None if not found)
+    def find_node(self, value):
+        if self._index is not None:
+            try:
+                bucket = self._index.get(value)
+            except TypeError:
+                pass  # Unhashable value, was never indexed → walk below
+            else:
+                return next(iter(bucket)) if bucket else None
+
+        sentinel = self._sentinel
+        itr = sentinel.next
+        while itr is not sentinel:
+            if itr.data == value:
+                return itr
+            itr = itr.next
+        return None
+
+    # Delete a node you already hold a reference to (O(1), no traversal)
+    def delete_node(self, node):
+        self._remove(node)
 
     # Insert at beginning
     def insert_at_beg(self, value):
-        node = Node(data=value)  # Create new node
-        if self.head:  # If list not empty
-            node.next = self.head  # New node points to current head
-            self.head.prev = node  # Current head points back to new node
-        else:  # If list empty
-            self.tail = node  # Tail also becomes new node
-        self.head = node  # Update head to new node
+        self._insert_after(self._sentinel, value)
         return
 
     # Insert at end
     def insert_at_end(self, value):
-        node = Node(data=value)  # Create new node
-        if self.tail:  # If list not empty
-            node.prev = self.tail  # New node points back to current tail
-            self.tail.next = node  # Current tail points forward to new node
-        else:  # If list empty
-            self.head = node  # Head also becomes new node
-        self.tail = node  # Update tail to new node
+        self._insert_after(self._sentinel.prev, value)
         return
 
     # Insert at a specific position (0-indexed)
     def insert_at_position(self, pos, value):
-        count = 0
-        itr = self.head  # Start from head
-        while itr:
-            if count + 1 == pos:  # Stop at node before position
-                break
-            itr = itr.next  # Move forward
-            count += 1
-        node = Node(data=value, next=itr.next, prev=itr)  # Create new node
-        if itr.next:  # If not inserting at end
-            itr.next.prev = node  # Next node points back to new node
-        itr.next = node  # Current node points forward to new node
+        itr = self._sentinel  # Start just before head
+        for _ in range(min(pos, self._size)):  # Stop at node before position
+            itr = itr.next
+        self._insert_after(itr, value)
         return
 
     # Delete last node
     def delete(self):
-        if not self.tail:  # Empty list
+        if self._size == 0:  # Empty list
             return
-        self.tail = self.tail.prev  # Move tail backward
-        if self.tail:  # If list still not empty
-            self.tail.next = None  # Remove forward pointer of new tail
-        else:  # List became empty
-            self.head = None
+        self._remove(self._sentinel.prev)
         return
 
     # Delete node at specific position
     def delete_at_position(self, pos):
-        if pos == 0 and self.head:  # Delete head
-            self.head = self.head.next
-            if self.head:
-                self.head.prev = None
-            else:
-                self.tail = None
+        if not 0 <= pos < self._size:  # No node at that position
             return
-        count = 0
-        itr = self.head
-        while itr:
-            if count == pos:
-                # Remove itr from the list
-                if itr.next:
-                    itr.next.prev = itr.prev
-                if itr.prev:
-                    itr.prev.next = itr.next
-                if itr == self.tail:
-                    self.tail = itr.prev
-                return
+        itr = self._sentinel.next
+        for _ in range(pos):
             itr = itr.next
-            count += 1
+        self._remove(itr)
 
-    # Count nodes
+    # Count nodes (O(1), tracked by the counter)
     def length(self):
-        count = 0
-        itr = self.head
-        while itr:
-            count += 1
-            itr = itr.next
-        return count
+        return self._size
 
     # Check if list is empty
     def is_empty(self):
-        return self.head is None
-
-    # Search for value and return index
+        return self._size == 0
+
+    # How many nodes hold value according to the index (None if unknown)
+    def _match_count(self, value):
+        if self._index is None:
+            return None
+        try:
+            return len(self._index.get(value, ()))
+        except TypeError:  # Unhashable → not indexed
+            return None
+
+    # Search for value and return index (of the first match)
     def search(self, value):
-        itr = self.head
+        matches = self._match_count(value)
+        if matches == 0:  # Index says the value is not in the list
+            return -1
+
+        sentinel = self._sentinel
+        if matches == 1:
+            # Exactly one match → whichever end reaches it first is right,
+            # so walk inward from head and tail at the same time
+            front, back = sentinel.next, sentinel.prev
+            lo, hi = 0, self._size - 1
+            while lo <= hi:
+                if front.data == value:
+                    return lo
+                if back.data == value:
+                    return hi
+                front, back = front.next, back.prev
+                lo += 1
+                hi -= 1
+            return -1
+
+        # Duplicates (or no index) → forward scan finds the first one
+        itr = sentinel.next
         index = 0
-        while itr:
+        while itr is not sentinel:
             if itr.data == value:
                 return index
             itr = itr.next
@@ -187,18 +285,20 @@ class LinkedList:
 
     # Display list (forward or backward)
     def display(self, is_backward=False):
-        itr = self.head if not is_backward else self.tail
-        dll = ""
-        while itr:
-            dll += f"{itr.data} --> "
+        sentinel = self._sentinel
+        itr = sentinel.next if not is_backward else sentinel.prev
+        parts = []  # Collect pieces, join once (avoids O(n²) string +=)
+        while itr is not sentinel:
+            parts.append(f"{itr.data} --> ")
             itr = itr.next if not is_backward else itr.prev
-        print(dll)
+        print("".join(parts))
         return
 
     # Iterator to use in loops
     def __iter__(self):
-        itr = self.head
-        while itr:
+        sentinel = self._sentinel
+        itr = sentinel.next
+        while itr is not sentinel:
             yield itr.data
             itr = itr.next
 
@@ -236,3 +336,11 @@ if __name__ == "__main__":
 
     # Using len()
     print("Length using len():", len(ll))
+
+    # O(1) lookup + delete by node reference
+    node = ll.find_node(77)
+    ll.delete_node(node)  # DLL: 21 <-> 45 <-> 55
+    ll.display()
+
+    # Bulk construction from an iterable
+    LinkedList.from_iterable([1, 2, 3, 4]).display()  # 1 --> 2 --> 3 --> 4 -->
@@ -44,7 +44,7 @@ Big-O Analysis (Array vs Linked List)
             Linked List → O(1) (just update head pointer).
         At End
             Array → O(1) amortized (dynamic resize can make it O(n) occasionally).
-            Linked List → O(n) (unless tail pointer is kept → then O(1)).
+            Linked List → O(1) (a tail pointer is kept; O(n) without it).
         In Middle
             Array → O(n) (shift elements).
             Linked List → O(1) if reference to node is known, else O(n) to find it.
@@ -66,6 +66,8 @@ Quick takeaway:
 
 """
 
+FREE_LIST_MAX = 64  # Most deleted nodes kept for reuse; the rest are freed
+
 
 # ===============================
 # Node Class
@@ -74,6 +76,10 @@ class Node:
     # This defines a class named 'Node'
     # A Node is the basic building block of a Linked List.
 
+    __slots__ = ("data", "next")
+    # Fixed attribute slots instead of a per-node __dict__:
+    # smaller nodes and faster itr.data / itr.next lookups.
+
     def __init__(self, data, next=None):
         # __init__ is the constructor method that runs when you create a new Node object.
         # 'data' is the value stored in the node.
@@ -89,6 +95,9 @@ class Node:
         # If next=None → this is the last node.
         # Otherwise, it points to another Node object.
 
+        # Note: LinkedList reuses deleted nodes, so a Node you kept a
+        # reference to (e.g. from get_last()) may later hold a new value.
+
 
 # ===============================
 # Singly Linked List Class
@@ -96,87 +105,175 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None  # Start with an empty list (head points to nothing)
+        self.tail = None  # Last node → appends don't have to walk the list
+        self._size = 0  # Node count, kept up to date by every insert/delete
+        self._free = None  # Pool of deleted nodes (chained via .next) for reuse
+        self._free_count = 0  # Nodes in the pool, at most FREE_LIST_MAX
+
+    # ---------------------------------
+    # Get a node: reuse one from the pool, or create a new one
+    # ---------------------------------
+    def _alloc(self, value, next=None):
+        node = self._free
+        if node is None:
+            return Node(data=value, next=next)
+        self._free = node.next  # Pop from the pool
+        self._free_count -= 1
+        node.data = value
+        node.next = next
+        return node
+
+    # ---------------------------------
+    # Give an unlinked node back to the pool (dropped if the pool is full)
+    # ---------------------------------
+    def _recycle(self, node):
+        node.data = None  # Drop the reference to the stored value
+        if self._free_count >= FREE_LIST_MAX:
+            node.next = None  # Not kept → garbage collected
+            return
+        node.next = self._free
+        self._free = node
+        self._free_count += 1
 
     # ---------------------------------
     # Insert node at the beginning (O(1))
     # ---------------------------------
     def insert_at_beg(self, value):
-        node = Node(data=value, next=self.head)  # New node points to current head
+        node = self._alloc(value, self.head)  # New node points to current head
         self.head = node  # Update head to new node
+        if self.tail is None:  # List was empty → new node is also the last
+            self.tail = node
+        self._size += 1
         return
 
     # ---------------------------------
-    # Insert node at the end (O(n))
+    # Insert node at the end (O(1), thanks to the tail pointer)
     # ---------------------------------
     def insert_at_end(self, value):
-        if self.head is None:  # Case 1: Empty list
-            self.head = Node(data=value)  # New node becomes head
+        node = self._alloc(value)
+        self._size += 1
+        if self.tail is None:  # Case 1: Empty list
+            self.head = self.tail = node  # New node becomes head and tail
             return
 
-        prev, last_el = self.get_last()  # Case 2: Find last node
-        last_el.next = Node(data=value)  # Attach new node after last
+        self.tail.next = node  # Case 2: Attach new node after last
+        self.tail = node
         return
 
     # ---------------------------------
-    # Insert node at a specific position (0-indexed) (O(n))
+    # Node just before position pos (1 <= pos <= length), one walk (O(n))
     # ---------------------------------
-    def insert_at_position(self, pos, value):
-        count = 0
+    def _node_before(self, pos):
         itr = self.head
-
-        # Traverse until reaching the desired position
-        while count != pos:
+        for _ in range(pos - 1):
             itr = itr.next
-            count += 1
+        return itr
 
-        # Insert new node: point it to current next, and link in chain
-        itr.next = Node(data=value, next=itr.next)
+    # ---------------------------------
+    # Insert node at a specific position (0-indexed) (O(n))
+    # ---------------------------------
+    def insert_at_position(self, pos, value):
+        if pos <= 0:  # New first node
+            return self.insert_at_beg(value)
+        if pos >= self._size:  # New last node
+            return self.insert_at_end(value)
+
+        # Insert new node: point it to prev's next, and link in chain
+        prev = self._node_before(pos)
+        prev.next = self._alloc(value, prev.next)
+        self._size += 1
         return
 
     # ---------------------------------
     # Delete the last node (O(n))
     # ---------------------------------
     def delete(self):
+        if self.head is None:  # Nothing to delete
+            return
+        if self.head is self.tail:  # Only one node → list becomes empty
+            self._recycle(self.head)
+            self.head = self.tail = None
+            self._size = 0
+            return
+
         prev, last = self.get_last()  # Get 2nd last and last node
         prev.next = None  # Remove last node by unlinking it
+        self.tail = prev  # 2nd last node is the new tail
+        self._recycle(last)
+        self._size -= 1
         return
 
     # ---------------------------------
     # Delete node at a specific position (O(n))
     # ---------------------------------
     def delete_at_position(self, pos):
-        count = 0
-        itr = self.head
-
-        # Traverse until reaching the node BEFORE target position
-        while count + 1 != pos:
-            itr = itr.next
-            count += 1
+        if pos < 0 or pos >= self._size:  # No node at that position
+            return
 
-        if not itr.data:  # If invalid node, do nothing
+        if pos == 0:  # Removing head
+            target = self.head
+            self.head = target.next
+            if self.head is None:  # List became empty
+                self.tail = None
+            self._recycle(target)
+            self._size -= 1
             return
 
+        prev = self._node_before(pos)
+        target = prev.next
+
         # Skip target node (unlink from chain)
-        itr.next = itr.next.next if itr.next else None
+        prev.next = target.next
+        if target is self.tail:  # Removed the last node → prev is the new tail
+            self.tail = prev
+        self._recycle(target)
+        self._size -= 1
         return
 
     # ---------------------------------
-    # Count number of nodes (O(n))
+    # Delete several positions in ONE walk (O(n))
+    # positions must be sorted ascending and refer to the list before deletion
+    # ---------------------------------
+    def delete_many(self, positions):
+        prev, itr = None, self.head
+        index = 0  # Position of itr before any deletion
+        for pos in positions:
+            if pos < index:  # Negative or repeated position
+                continue
+            while itr is not None and index < pos:
+                prev, itr = itr, itr.next
+                index += 1
+            if itr is None:  # Past the end → nothing left to delete
+                break
+
+            # Unlink itr
+            nxt = itr.next
+            if prev is None:
+                self.head = nxt
+            else:
+                prev.next = nxt
+            if itr is self.tail:
+                self.tail = prev
+            self._recycle(itr)
+            self._size -= 1
+            itr = nxt
+            index += 1
+        return
+
+    # ---------------------------------
+    # Count number of nodes (O(1), tracked by the counter)
     # ---------------------------------
     def length(self):
-        count = 0
-        itr = self.head
-        while itr:  # Traverse list until end
-            count += 1
-            itr = itr.next
-        return count
+        return self._size
 
     # ---------------------------------
     # Get last node and its previous node (O(n))
+    # (the nodes are only valid until deleted: deleted nodes get reused)
     # ---------------------------------
     def get_last(self):
         prev, itr = None, self.head
-        while itr.next:  # Traverse until reaching last node
+        last = self.tail  # Known last node → identity check ends the walk
+        while itr is not last:  # Traverse until reaching last node
             prev = itr
             itr = itr.next
         return prev, itr
@@ -185,7 +282,7 @@ class LinkedList:
     # Check if list is empty (O(1))
     # ---------------------------------
     def is_empty(self):
-        return True if self.head is None else False
+        return self.head is None
 
     # ---------------------------------
     # Search for value and return index (O(n))
@@ -204,12 +301,8 @@ class LinkedList:
     # Display linked list (O(n))
     # ---------------------------------
     def display(self):
-        ll = ""
-        itr = self.head
-        while itr:
-            ll += f"{itr.data} --> "  # Collect nodes into string
-            itr = itr.next
-        print(ll)
+        # Build the string in one join over __iter__ (avoids O(n²) string +=)
+        print("".join(f"{value} --> " for value in self))
 
     # ---------------------------------
     # Make LinkedList iterable (support for `for x in ll`)
@@ -221,7 +314,7 @@ class LinkedList:
             itr = itr.next
 
     # ---------------------------------
-    # Support len() function (O(n))
+    # Support len() function (O(1))
     # ---------------------------------
     def __len__(self):
         return self.length()
@@ -246,6 +339,9 @@ if __name__ == "__main__":
     print("target found at index --> ", ll.search(55))  # Should return index of 55
     ll.display()
 
+    ll.delete_many([0, 2])  # One walk removes 21 and 55 → 45
+    ll.display()
+
     # Iterating with __iter__
     for value in ll:
         print("iterated value:", value)
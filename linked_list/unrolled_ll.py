@@ -0,0 +1,269 @@
+"""
+==============================
+Unrolled Singly Linked List in Python
+==============================
+
+What is different from sll.py?
+------------------------------
+sll.py allocates one Node object per element, so a traversal hops from
+object to object across the heap, one value per hop.
+
+An unrolled linked list keeps the same chain of nodes, but every node (a
+"Chunk") holds up to CAPACITY values in a small array:
+
+    head                                   tail
+     ↓                                      ↓
+    [21 45 77 55 .. ..] → [85 90 .. .. .. ..] → None
+     count = 4             count = 2
+
+    • One Chunk object per CAPACITY values → far fewer Python objects.
+    • Traversal walks a chunk's array with a plain index loop and only
+      follows a `next` pointer once per chunk.
+    • A tail pointer makes appends O(1).
+
+Insert/delete inside a chunk shift at most CAPACITY values; a full chunk
+is split in two halves, an emptied chunk is unlinked.
+
+Big-O
+-----
+Insert at beginning   : O(1)   (shift ≤ CAPACITY values)
+Insert at end         : O(1)   (tail pointer)
+Insert/Delete middle  : O(n / CAPACITY) to find the chunk + O(CAPACITY)
+Delete at end         : O(n / CAPACITY) (need the chunk before tail when it empties)
+Search / traversal    : O(n)
+Length                : O(1)   (tracked by a counter)
+"""
+
+CAPACITY = 32  # Values per chunk
+
+
+# ===============================
+# Chunk class (one node holding up to CAPACITY values)
+# ===============================
+class Chunk:
+    __slots__ = ("items", "count", "next")
+
+    def __init__(self, next=None):
+        self.items = [None] * CAPACITY  # Fixed-size value array
+        self.count = 0  # Number of used slots (items[0:count])
+        self.next = next  # Next chunk (None at the end)
+
+
+# ===============================
+# Unrolled Singly Linked List Class
+# ===============================
+class UnrolledLinkedList:
+    def __init__(self):
+        self.head = None  # First chunk
+        self.tail = None  # Last chunk → O(1) insert_at_end
+        self._size = 0  # Number of values (not chunks)
+
+    # ---------------------------------
+    # Build from any iterable, filling every chunk completely (O(n))
+    # ---------------------------------
+    @classmethod
+    def from_iterable(cls, values):
+        ll = cls()
+        for value in values:
+            ll.insert_at_end(value)
+        return ll
+
+    # ---------------------------------
+    # Insert value at the beginning (O(1))
+    # ---------------------------------
+    def insert_at_beg(self, value):
+        head = self.head
+        if head is None or head.count == CAPACITY:
+            # Start a new chunk in front instead of splitting a full one
+            head = self.head = Chunk(next=head)
+            if self.tail is None:
+                self.tail = head
+        items = head.items
+        items[1 : head.count + 1] = items[0 : head.count]  # Shift right by one
+        items[0] = value
+        head.count += 1
+        self._size += 1
+        return
+
+    # ---------------------------------
+    # Insert value at the end (O(1))
+    # ---------------------------------
+    def insert_at_end(self, value):
+        tail = self.tail
+        if tail is None or tail.count == CAPACITY:
+            chunk = Chunk()
+            if tail is None:  # Empty list
+                self.head = chunk
+            else:
+                tail.next = chunk
+            tail = self.tail = chunk
+        tail.items[tail.count] = value
+        tail.count += 1
+        self._size += 1
+        return
+
+    # ---------------------------------
+    # Find the chunk holding position pos
+    # Returns (previous chunk, chunk, offset inside chunk)
+    # ---------------------------------
+    def _locate(self, pos):
+        prev, chunk = None, self.head
+        while pos >= chunk.count:
+            pos -= chunk.count
+            prev, chunk = chunk, chunk.next
+        return prev, chunk, pos
+
+    # ---------------------------------
+    # Insert value at a specific position (0-indexed)
+    # Negative positions insert at the front (unlike list.insert)
+    # ---------------------------------
+    def insert_at_position(self, pos, value):
+        if pos <= 0:
+            return self.insert_at_beg(value)
+        if pos >= self._size:
+            return self.insert_at_end(value)
+
+        _, chunk, offset = self._locate(pos)
+        if chunk.count == CAPACITY:
+            # Split: move the upper half into a new chunk right after this one
+            half = CAPACITY // 2
+            new = Chunk(next=chunk.next)
+            new.items[0 : CAPACITY - half] = chunk.items[half:CAPACITY]
+            new.count = CAPACITY - half
+            chunk.items[half:CAPACITY] = [None] * (CAPACITY - half)
+            chunk.count = half
+            chunk.next = new
+            if chunk is self.tail:
+                self.tail = new
+            if offset > half:
+                chunk, offset = new, offset - half
+
+        items, count = chunk.items, chunk.count
+        items[offset + 1 : count + 1] = items[offset:count]  # Shift right by one
+        items[offset] = value
+        chunk.count += 1
+        self._size += 1
+        return
+
+    # ---------------------------------
+    # Unlink an empty chunk (prev is the chunk before it, or None for head)
+    # ---------------------------------
+    def _unlink(self, prev, chunk):
+        if prev is None:
+            self.head = chunk.next
+        else:
+            prev.next = chunk.next
+        if chunk is self.tail:
+            self.tail = prev
+
+    # ---------------------------------
+    # Delete the last value
+    # ---------------------------------
+    def delete(self):
+        tail = self.tail
+        if tail is None:  # Empty list
+            return
+        tail.count -= 1
+        tail.items[tail.count] = None  # Drop the reference to the value
+        self._size -= 1
+        if tail.count == 0:
+            # Tail chunk emptied → find the chunk before it
+            prev, chunk = None, self.head
+            while chunk is not tail:
+                prev, chunk = chunk, chunk.next
+            self._unlink(prev, tail)
+        return
+
+    # ---------------------------------
+    # Delete value at a specific position
+    # ---------------------------------
+    def delete_at_position(self, pos):
+        if pos < 0 or pos >= self._size:  # Nothing at that position
+            return
+
+        prev, chunk, offset = self._locate(pos)
+        items, count = chunk.items, chunk.count
+        items[offset : count - 1] = items[offset + 1 : count]  # Shift left by one
+        items[count - 1] = None
+        chunk.count -= 1
+        self._size -= 1
+        if chunk.count == 0:
+            self._unlink(prev, chunk)
+        return
+
+    # ---------------------------------
+    # Count values (O(1))
+    # ---------------------------------
+    def length(self):
+        return self._size
+
+    # ---------------------------------
+    # Check if list is empty (O(1))
+    # ---------------------------------
+    def is_empty(self):
+        return self._size == 0
+
+    # ---------------------------------
+    # Search for value and return index (O(n))
+    # ---------------------------------
+    def search(self, value):
+        chunk = self.head
+        base = 0  # Index of the chunk's first value
+        while chunk:
+            count = chunk.count
+            for i in range(count):
+                if chunk.items[i] == value:  # Value found
+                    return base + i
+            base += count
+            chunk = chunk.next
+        return -1  # Not found
+
+    # ---------------------------------
+    # Display list (O(n))
+    # ---------------------------------
+    def display(self):
+        print("".join(f"{value} --> " for value in self))
+
+    # ---------------------------------
+    # Make the list iterable, one chunk at a time
+    # ---------------------------------
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            items, nxt = chunk.items, chunk.next  # Locals before the inner loop
+            for i in range(chunk.count):
+                yield items[i]
+            chunk = nxt
+
+    # ---------------------------------
+    # Support len() function (O(1))
+    # ---------------------------------
+    def __len__(self):
+        return self._size
+
+
+# -----------------------------
+# Example usage
+# -----------------------------
+if __name__ == "__main__":
+    ll = UnrolledLinkedList()
+    ll.insert_at_end(45)  # 45
+    ll.insert_at_end(55)  # 45 -> 55
+    ll.insert_at_end(85)  # 45 -> 55 -> 85
+    ll.insert_at_beg(21)  # 21 -> 45 -> 55 -> 85
+    ll.insert_at_position(2, 77)  # 21 -> 45 -> 77 -> 55 -> 85
+    ll.display()
+
+    ll.delete()  # Delete last value → removes 85
+    ll.delete_at_position(2)  # Delete value at index 2 → removes 77
+    print("linked list length", ll.length())  # 3
+    print("is linked list empty", ll.is_empty())  # False
+    print("target found at index --> ", ll.search(55))  # 2
+    ll.display()
+
+    # 100 values fit into 4 chunks of up to 32 values
+    big = UnrolledLinkedList.from_iterable(range(100))
+    chunks, c = 0, big.head
+    while c:
+        chunks, c = chunks + 1, c.next
+    print("values:", len(big), "chunks:", chunks)  # values: 100 chunks: 4
@@ -49,44 +49,131 @@ Time Complexity (Big-O)
 # Import deque from collections
 # deque (double-ended queue) is ideal for implementing queues
 # It allows us to add/remove elements from both ends in O(1) time.
+from array import array
 from collections import deque
 
 
 class Queue:
     """Class to represent a Queue using deque"""
 
+    # Fixed slots instead of a per-instance __dict__
+    __slots__ = ("container", "_append", "_popleft")
+
     def __init__(self):
         # Initialize an empty deque container for queue elements
         self.container = deque()
+        # Bound deque methods, looked up once instead of on every call
+        self._append = self.container.append
+        self._popleft = self.container.popleft
 
     def enqueue(self, data):
         """Add (enqueue) an element at the rear of the queue"""
-        # Append element to the left to maintain FIFO order
-        self.container.appendleft(data)
+        # Append element to the right end (rear) to maintain FIFO order
+        self._append(data)
 
     def dequeue(self):
         """Remove (dequeue) the front element from the queue"""
-        # Check if queue is empty to avoid underflow
-        if self.is_empty():
-            return "Queue Underflow"  # Error message if no element exists
-        return self.container.pop()  # Removes and returns the rightmost element
+        # Dequeuing from an empty queue is an error (underflow)
+        if not self.container:
+            raise IndexError("Queue Underflow")
+        return self._popleft()  # Removes and returns the leftmost element
 
     def peek(self):
         """View the front element without removing it"""
-        # Check if queue is empty
-        if self.is_empty():
-            return "Queue is Empty"
-        return self.container[-1]  # Rightmost element is the front of the queue
+        # An empty queue has no front element
+        if not self.container:
+            raise IndexError("Queue is Empty")
+        return self.container[0]  # Leftmost element is the front of the queue
 
     def is_empty(self):
         """Check if the queue is empty"""
-        return len(self.container) == 0
+        return not self.container  # An empty deque is falsy
 
     def size(self):
         """Return the number of elements in the queue"""
         return len(self.container)
 
 
+class IntQueue:
+    """Fixed-capacity queue of integers stored in a ring buffer"""
+
+    __slots__ = ("buf", "head", "tail", "count", "cap")
+
+    def __init__(self, cap):
+        # Preallocated array of 8-byte ints: no Python object per element
+        self.buf = array("q", bytes(8 * cap))
+        self.cap = cap
+        self.head = 0  # Index of the front element
+        self.tail = 0  # Index where the next element is written
+        self.count = 0
+
+    def enqueue(self, value):
+        """Add an integer at the rear of the queue"""
+        if self.count == self.cap:
+            raise OverflowError("Queue Overflow")
+        self.buf[self.tail] = value
+        self.tail = (self.tail + 1) % self.cap  # Wrap around the ring
+        self.count += 1
+
+    def dequeue(self):
+        """Remove and return the front integer"""
+        if not self.count:
+            raise IndexError("Queue Underflow")
+        value = self.buf[self.head]
+        self.head = (self.head + 1) % self.cap
+        self.count -= 1
+        return value
+
+    def peek(self):
+        """View the front integer without removing it"""
+        if not self.count:
+            raise IndexError("Queue is Empty")
+        return self.buf[self.head]
+
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return not self.count
+
+    def size(self):
+        """Return the number of elements in the queue"""
+        return self.count
+
+
+def bfs(adj_indptr, adj_indices, source):
+    """
+    Breadth-First Search over a graph of vertices 0..n-1 and return the
+    vertices in the order they are visited.
+    The graph is given in compressed form: the neighbours of vertex v are
+    adj_indices[adj_indptr[v]:adj_indptr[v + 1]].
+    The queue is an IntQueue with one slot per vertex. Every vertex is
+    enqueued at most once, so it never wraps around and its buffer ends up
+    holding the visit order. The loop works on the buffer and two local
+    indexes directly, with no method call per vertex.
+    """
+    n = len(adj_indptr) - 1
+    if not 0 <= source < n:
+        raise ValueError(f"source {source} is not a vertex (graph has {n} vertices)")
+
+    visited = bytearray(n)
+    queue = IntQueue(cap=n)
+    queue.enqueue(source)
+    visited[source] = 1
+
+    buf = queue.buf
+    head, tail = 0, queue.count  # Plain indexes: no wrap-around is needed
+    while head < tail:
+        v = buf[head]  # Dequeue
+        head += 1
+        for i in range(adj_indptr[v], adj_indptr[v + 1]):
+            w = adj_indices[i]
+            if not visited[w]:
+                visited[w] = 1
+                buf[tail] = w  # Enqueue
+                tail += 1
+
+    return buf[:tail].tolist()
+
+
 # ================================
 # Example Usage of Queue
 # ================================
@@ -113,3 +200,22 @@ if __name__ == "__main__":
 
     # Now queue should be empty
     print("Is queue empty?", q.is_empty())  # Expected: True
+
+    # Dequeuing from an empty queue raises IndexError
+    try:
+        q.dequeue()
+    except IndexError as error:
+        print("Error:", error)  # Expected: Queue Underflow
+
+    # Integer-only queue backed by a ring buffer
+    iq = IntQueue(cap=2)
+    iq.enqueue(1)
+    iq.enqueue(2)
+    print("Dequeued:", iq.dequeue())  # Expected: 1
+    iq.enqueue(3)  # Reuses the freed slot (wraps around)
+    print("Dequeued:", iq.dequeue(), iq.dequeue())  # Expected: 2 3
+
+    # BFS over the graph 0-1, 0-2, 1-3, 2-3, 3-4
+    indptr = [0, 2, 4, 6, 9, 10]
+    indices = [1, 2, 0, 3, 0, 3, 1, 2, 4, 3]
+    print("BFS order:", bfs(indptr, indices, 0))  # Expected: [0, 1, 2, 3, 4]
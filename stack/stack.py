@@ -58,33 +58,39 @@ from collections import deque
 class Stack:
     """Class to represent a Stack using deque"""
 
+    # Fixed slots instead of a per-instance __dict__
+    __slots__ = ("container", "_push", "_pop")
+
     def __init__(self):
         # Initialize an empty deque container for stack elements
         self.container = deque()
+        # Bound deque methods, looked up once instead of on every call
+        self._push = self.container.append
+        self._pop = self.container.pop
 
     def push(self, data):
         """Add (push) an element onto the stack"""
         # Append adds the element to the right end (top of the stack)
-        self.container.append(data)
+        self._push(data)
 
     def pop(self):
         """Remove (pop) the top element from the stack"""
-        # Check if stack is empty to avoid underflow
-        if self.is_empty():
-            return "Stack Underflow"  # Error message if no element exists
-        return self.container.pop()  # Removes and returns the last element
+        # Popping from an empty stack is an error (underflow)
+        if not self.container:
+            raise IndexError("Stack Underflow")
+        return self._pop()  # Removes and returns the last element
 
     def peek(self):
         """View the top element without removing it"""
-        # Check if stack is empty
-        if self.is_empty():
-            return "Stack is Empty"  # Error message if no element exists
+        # An empty stack has no top element
+        if not self.container:
+            raise IndexError("Stack is Empty")
         return self.container[-1]  # Return last element (top of stack)
 
     def is_empty(self):
         """Check if the stack is empty"""
         # Returns True if stack has no elements
-        return len(self.container) == 0
+        return not self.container  # An empty deque is falsy
 
     def size(self):
         """Return the number of elements in the stack"""
@@ -1,42 +1,160 @@
+import sys
+from array import array
+
+# How print() shows one node, per `type` argument
+_FORMATTERS = {
+    "both": lambda name, designation: f"{name} ({designation})",
+    "name": lambda name, designation: f"{name}",
+    "designation": lambda name, designation: f"{designation}",
+}
+
+# Line prefix per level, built once instead of " " * level + "|__" per node
+_PREFIXES = [" " * level + "|__" for level in range(64)]
+
+
+def _line_prefix(level, is_root):
+    if is_root:  # the root has no indent and no "|__"
+        return ""
+    if level < len(_PREFIXES):
+        return _PREFIXES[level]
+    return " " * level + "|__"  # deeper than the table
+
+
 class TreeNode:
+    __slots__ = ("name", "designation", "children", "parent", "level")
+
     def __init__(self, name, designation):
         self.name = name
-        self.designation = designation
+        # Many people share a designation → share one string object for it
+        # (exact str only: sys.intern() rejects str subclasses)
+        self.designation = (
+            sys.intern(designation) if type(designation) is str else designation
+        )
         self.children = []
         self.parent = None
+        self.level = 0  # depth below the root, kept up to date by add_child
 
     def add_child(self, child):
         child.parent = self
         self.children.append(child)
 
-    def get_level(self):
-        count = 0
-
-        parent = self.parent
-        while parent:
-            count += 1
-            parent = parent.parent
+        # The child's subtree moved one level below self → renumber it
+        # (trees may be built bottom-up, so the subtree can already be deep)
+        child.level = self.level + 1
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            for grandchild in node.children:
+                grandchild.level = node.level + 1
+                stack.append(grandchild)
 
-        return count
+    def get_level(self):
+        return self.level
+
+    def finalize(self):
+        # Call once the tree is complete: turn every children list in this
+        # subtree into a tuple (no over-allocated spare capacity).
+        # add_child() can no longer be used on finalized nodes.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.children = tuple(node.children)
+            stack.extend(node.children)
 
     def print(self, type="both"):
-        data = ""
-        if type == "both":
-            data = f"{self.name} ({self.designation})"
-        elif type == "name":
-            data = f"{self.name}"
-        elif type == "designation":
-            data = f"{self.designation}"
-        else:
+        # Pick the formatter once instead of re-checking `type` for every node
+        fmt = _FORMATTERS.get(type)
+        if fmt is None:
             print("Invalid type!")
+            return
+
+        # Format the walk's nodes and write all lines out in one go
+        lines = [
+            f"{_line_prefix(level, node.parent is None)} "
+            f"{fmt(node.name, node.designation)}"
+            for level, node in self.walk()
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def walk(self):
+        # Yield (level, node) for this subtree in depth-first (print) order.
+        # Explicit stack, no recursion; callers may stop early.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node.level, node
+            stack.extend(reversed(node.children))  # leftmost child on top
+
+
+class FlatTree:
+    """
+    Read-only copy of a TreeNode tree in parallel arrays, one slot per node.
+    Nodes are numbered in depth-first (print) order, so printing is a plain
+    loop over the slots instead of a walk through node objects.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.designation_table = []  # each distinct designation once
+        self.designation_id = array("i")  # index into designation_table
+        self.parent = array("i")  # parent slot, -1 for the root
+        self.first_child = array("i")  # -1 for a leaf
+        self.next_sibling = array("i")  # -1 for the last child
+        self.level = array("i")
+
+    @classmethod
+    def from_root(cls, root):
+        flat = cls()
+        last_child = array("i")  # newest child seen so far, per slot
+        ids = {}  # designation → index in designation_table
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            i = len(flat.names)
+            flat.names.append(node.name)
+            desig_id = ids.get(node.designation)
+            if desig_id is None:
+                desig_id = ids[node.designation] = len(flat.designation_table)
+                flat.designation_table.append(node.designation)
+            flat.designation_id.append(desig_id)
+            flat.parent.append(parent)
+            flat.first_child.append(-1)
+            flat.next_sibling.append(-1)
+            flat.level.append(flat.level[parent] + 1 if parent != -1 else 0)
+            last_child.append(-1)
+
+            if parent != -1:
+                if last_child[parent] == -1:
+                    flat.first_child[parent] = i
+                else:
+                    flat.next_sibling[last_child[parent]] = i
+                last_child[parent] = i
+
+            stack.extend((child, i) for child in reversed(node.children))
+        return flat
+
+    def __len__(self):
+        return len(self.names)
+
+    def children(self, i):
+        child = self.first_child[i]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
 
-        prefix = " " * self.get_level() + ("|__" if self.parent else "")
-
-        print(prefix, data)
+    def print(self, type="both"):
+        fmt = _FORMATTERS.get(type)
+        if fmt is None:
+            print("Invalid type!")
+            return
 
-        if self.children:
-            for child in self.children:
-                child.print(type=type)
+        names, table, desig_id = self.names, self.designation_table, self.designation_id
+        parent, level = self.parent, self.level
+        lines = []
+        for i in range(len(names)):
+            prefix = _line_prefix(level[i], parent[i] == -1)
+            lines.append(f"{prefix} {fmt(names[i], table[desig_id[i]])}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def build_tree():
@@ -114,6 +232,13 @@ def build_tree():
 
 if __name__ == "__main__":
     tree = build_tree()
+    tree.finalize()  # the tree is only read from here on
     tree.print()
     tree.print(type="name")
     tree.print(type="designation")
+
+    # Same tree, flattened into arrays once it is fully built
+    flat = FlatTree.from_root(tree)
+    flat.print(type="name")
+    print("CEO reports:", [flat.names[i] for i in flat.children(0)])
+    print("distinct designations:", len(flat.designation_table), "of", len(flat))
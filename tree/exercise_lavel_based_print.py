@@ -1,151 +1,240 @@
+import sys
+from collections import deque
+
+# Indent string per level, built once instead of " " * level * 4 per node
+_INDENTS = tuple(" " * (4 * level) for level in range(64))
+
+
+def _intern(value):
+    """Intern strings so that equal node values share one object"""
+    # Exact str only: sys.intern() rejects str subclasses
+    return sys.intern(value) if type(value) is str else value
+
+
 class TreeNode:
     """Class to represent a node in a tree"""
 
-    def __init__(self, data):
-        self.data = data
+    # No per-node __dict__
+    __slots__ = ("data", "parent", "children", "level", "_cached_layout", "_rendered")
+
+    def __init__(self, data, parent=None):
+        self.data = _intern(data)  # Share one object between equal strings
         self.parent = None
         self.children = []
+        self.level = 0  # Depth below the root, kept up to date by add_child
+        self._cached_layout = None  # Rendered subtree, see _layout()
+        self._rendered = None  # print() output per level, see print()
+
+        # Attach right away when the parent is known (top-down building):
+        # the new node has no subtree yet, so its level is set in O(1)
+        if parent is not None:
+            parent.add_child(self)
 
     def add_child(self, child):
         """Add a child to this node"""
         child.parent = self
         self.children.append(child)
 
+        # This node and its ancestors now have a different layout
+        node = self
+        while node is not None:
+            node._forget_render()
+            node = node.parent
+
+        # Renumber the child's subtree: it may have been built before being
+        # attached (bottom-up), so its descendants need new levels too
+        child.level = self.level + 1
+        child._forget_render()
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            for grandchild in node.children:
+                grandchild.level = node.level + 1
+                grandchild._forget_render()
+                stack.append(grandchild)
+
+    def _forget_render(self):
+        """Drop cached layout and output after the subtree changed"""
+        self._cached_layout = None
+        self._rendered = None
+
     def get_level(self):
-        """Return the depth level of the node"""
-        level = 0
-        parent = self.parent
-        while parent:
-            level += 1
-            parent = parent.parent
-        return level
+        """Return the depth level of the node (cached, O(1))"""
+        return self.level
+
+    def finalize(self):
+        """
+        Call once the tree is complete: turn every children list in this
+        subtree into a tuple (no over-allocated spare capacity).
+        add_child() can no longer be used on finalized nodes.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.children = tuple(node.children)
+            stack.extend(node.children)
+
+    def _layout(self):
+        """
+        Return [level, line, end] for every node of this subtree in print
+        order, where `end` is the index just past the node's subtree.
+        Built once with an explicit-stack DFS, then reused by every print().
+        """
+        if self._cached_layout is None:
+            layout = []
+            stack = [self]
+            while stack:
+                item = stack.pop()
+                if type(item) is int:  # Subtree of layout[item] is complete
+                    layout[item][2] = len(layout)
+                    continue
+
+                node = item
+                level = node.level
+                indent = _INDENTS[level] if level < len(_INDENTS) else " " * (4 * level)
+                prefix = "|__" if node.parent else ""
+                layout.append([level, f"{indent}{prefix}{node.data}", 0])
+                stack.append(len(layout) - 1)  # Popped after all descendants
+                stack.extend(reversed(node.children))  # Leftmost child on top
+            self._cached_layout = layout
+        return self._cached_layout
 
     def print(self, level=1):
-        """Recursively print the tree structure"""
-        indent = " " * self.get_level() * 4
-        prefix = "|__" if self.parent else ""
-        print(f"{indent}{prefix}{self.data}")
-
-        tree_level = self.get_level()
-
-        for child in self.children:
-            if tree_level == level:
-                break
-
-            child.print(level=level)
+        """Print the tree structure down to `level`"""
+        level = max(level, self.level)  # Always show the starting node
+
+        # Same level printed before → reuse the finished text
+        if self._rendered is None:
+            self._rendered = {}
+        text = self._rendered.get(level)
+        if text is None:
+            layout = self._layout()
+            lines = []
+            i = 0
+            while i < len(layout):
+                depth, line, end = layout[i]
+                lines.append(line)
+                # A node at `level` is shown, its subtree is jumped over
+                i = i + 1 if depth < level else end
+            text = self._rendered[level] = "\n".join(lines) + "\n"
+        sys.stdout.write(text)
+
+    def bfs(self):
+        """
+        Yield (node, level) for this subtree level by level (breadth-first).
+        deque.popleft() is O(1), unlike list.pop(0).
+        """
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node, node.level
+            queue.extend(node.children)
+
+    def print_by_level(self, level=None):
+        """Print one line per level, stopping after `level` (None → all)"""
+        rows = []
+        for node, depth in self.bfs():
+            if level is not None and depth > level:
+                break  # Levels only grow from here on
+            if not rows or rows[-1][0] != depth:
+                rows.append((depth, []))
+            rows[-1][1].append(str(node.data))
+
+        sys.stdout.write(
+            "".join(f"Level {depth}: {', '.join(names)}\n" for depth, names in rows)
+        )
+
+
+# World hierarchy as (name, children) pairs; a plain string is a leaf
+WORLD_SPEC = (
+    "Earth",
+    (
+        (
+            "Bangladesh",
+            (
+                (
+                    "Dhaka Division",
+                    (
+                        ("Dhaka District", ("Dhaka City", "Savar", "Dhamrai")),
+                        ("Narayanganj District", ("Narayanganj City", "Rupganj")),
+                    ),
+                ),
+                (
+                    "Chittagong Division",
+                    (
+                        ("Chittagong District", ("Chittagong City", "Cox's Bazar")),
+                        ("Comilla District", ("Comilla City", "Daudkandi")),
+                    ),
+                ),
+            ),
+        ),
+        (
+            "Pakistan",
+            (
+                (
+                    "Punjab Province",
+                    (
+                        ("Lahore District", ("Lahore City", "Shahdara", "Cantt")),
+                        ("Faisalabad District", ("Faisalabad City", "Jaranwala")),
+                    ),
+                ),
+                (
+                    "Sindh Province",
+                    (
+                        ("Karachi District", ("Karachi City", "Korangi", "Gulshan")),
+                        ("Hyderabad District", ("Hyderabad City", "Latifabad")),
+                    ),
+                ),
+            ),
+        ),
+        (
+            "Malaysia",
+            (
+                (
+                    "Selangor State",
+                    (
+                        (
+                            "Kuala Lumpur District",
+                            ("Kuala Lumpur City", "Petaling Jaya", "Shah Alam"),
+                        ),
+                        ("Petaling District", ("Subang Jaya", "Puchong")),
+                    ),
+                ),
+                (
+                    "Johor State",
+                    (
+                        ("Johor Bahru District", ("Johor Bahru City", "Pasir Gudang")),
+                        ("Batu Pahat District", ("Batu Pahat City", "Kluang")),
+                    ),
+                ),
+            ),
+        ),
+    ),
+)
+
+
+def build(spec):
+    """Build a tree from a (name, children) spec in one loop (no recursion)"""
+    name, children = spec
+    root = TreeNode(name)
+    stack = [(root, children)]
+    while stack:
+        parent, children = stack.pop()
+        for child in children:
+            if isinstance(child, str):  # Leaf
+                TreeNode(child, parent=parent)
+            else:
+                name, grandchildren = child
+                stack.append((TreeNode(name, parent=parent), grandchildren))
+
+    # Construction is done → freeze the children lists
+    root.finalize()
+    return root
 
 
 def build_tree():
     """Build an expanded hierarchical world tree with multiple states, districts, and cities"""
-    world = TreeNode("Earth")
-
-    # --------------------
-    # Bangladesh
-    # --------------------
-    bangladesh = TreeNode("Bangladesh")
-
-    # Dhaka Division
-    dhaka_div = TreeNode("Dhaka Division")
-    dhaka_district = TreeNode("Dhaka District")
-    dhaka_district.add_child(TreeNode("Dhaka City"))
-    dhaka_district.add_child(TreeNode("Savar"))
-    dhaka_district.add_child(TreeNode("Dhamrai"))
-
-    narayanganj_district = TreeNode("Narayanganj District")
-    narayanganj_district.add_child(TreeNode("Narayanganj City"))
-    narayanganj_district.add_child(TreeNode("Rupganj"))
-
-    dhaka_div.add_child(dhaka_district)
-    dhaka_div.add_child(narayanganj_district)
-
-    # Chittagong Division
-    chittagong_div = TreeNode("Chittagong Division")
-    chittagong_district = TreeNode("Chittagong District")
-    chittagong_district.add_child(TreeNode("Chittagong City"))
-    chittagong_district.add_child(TreeNode("Cox's Bazar"))
-
-    comilla_district = TreeNode("Comilla District")
-    comilla_district.add_child(TreeNode("Comilla City"))
-    comilla_district.add_child(TreeNode("Daudkandi"))
-
-    chittagong_div.add_child(chittagong_district)
-    chittagong_div.add_child(comilla_district)
-
-    bangladesh.add_child(dhaka_div)
-    bangladesh.add_child(chittagong_div)
-    world.add_child(bangladesh)
-
-    # --------------------
-    # Pakistan
-    # --------------------
-    pakistan = TreeNode("Pakistan")
-
-    # Punjab Province
-    punjab = TreeNode("Punjab Province")
-    lahore_district = TreeNode("Lahore District")
-    lahore_district.add_child(TreeNode("Lahore City"))
-    lahore_district.add_child(TreeNode("Shahdara"))
-    lahore_district.add_child(TreeNode("Cantt"))
-
-    faisalabad_district = TreeNode("Faisalabad District")
-    faisalabad_district.add_child(TreeNode("Faisalabad City"))
-    faisalabad_district.add_child(TreeNode("Jaranwala"))
-
-    punjab.add_child(lahore_district)
-    punjab.add_child(faisalabad_district)
-
-    # Sindh Province
-    sindh = TreeNode("Sindh Province")
-    karachi_district = TreeNode("Karachi District")
-    karachi_district.add_child(TreeNode("Karachi City"))
-    karachi_district.add_child(TreeNode("Korangi"))
-    karachi_district.add_child(TreeNode("Gulshan"))
-
-    hyderabad_district = TreeNode("Hyderabad District")
-    hyderabad_district.add_child(TreeNode("Hyderabad City"))
-    hyderabad_district.add_child(TreeNode("Latifabad"))
-
-    sindh.add_child(karachi_district)
-    sindh.add_child(hyderabad_district)
-
-    pakistan.add_child(punjab)
-    pakistan.add_child(sindh)
-    world.add_child(pakistan)
-
-    # --------------------
-    # Malaysia
-    # --------------------
-    malaysia = TreeNode("Malaysia")
-
-    selangor = TreeNode("Selangor State")
-    kl_district = TreeNode("Kuala Lumpur District")
-    kl_district.add_child(TreeNode("Kuala Lumpur City"))
-    kl_district.add_child(TreeNode("Petaling Jaya"))
-    kl_district.add_child(TreeNode("Shah Alam"))
-
-    pj_district = TreeNode("Petaling District")
-    pj_district.add_child(TreeNode("Subang Jaya"))
-    pj_district.add_child(TreeNode("Puchong"))
-
-    selangor.add_child(kl_district)
-    selangor.add_child(pj_district)
-
-    johor = TreeNode("Johor State")
-    jb_district = TreeNode("Johor Bahru District")
-    jb_district.add_child(TreeNode("Johor Bahru City"))
-    jb_district.add_child(TreeNode("Pasir Gudang"))
-
-    batu_pahat_district = TreeNode("Batu Pahat District")
-    batu_pahat_district.add_child(TreeNode("Batu Pahat City"))
-    batu_pahat_district.add_child(TreeNode("Kluang"))
-
-    johor.add_child(jb_district)
-    johor.add_child(batu_pahat_district)
-
-    malaysia.add_child(selangor)
-    malaysia.add_child(johor)
-    world.add_child(malaysia)
-    return world
+    return build(WORLD_SPEC)
 
 
 if __name__ == "__main__":
@@ -153,3 +242,4 @@ if __name__ == "__main__":
     tree.print()
     tree.print(3)
     tree.print(4)
+    tree.print_by_level(2)
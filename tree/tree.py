@@ -12,7 +12,7 @@ This particular tree is a **General Tree**:
 Common Operations:
 - add_child → Add a child node.
 - get_level → Determine node depth (root is level 0).
-- print_tree → Recursively display the tree.
+- print_tree → Display the tree (depth-first).
 
 Why Use a General Tree?
 - Hierarchical data representation.
@@ -24,49 +24,191 @@ Pros
 - Flexible → Nodes can have any number of children.
 
 Cons
-- Traversal can be recursive → stack overflow for very deep trees.
+- Recursive traversal can overflow the stack for very deep trees
+  (print_tree uses an explicit stack instead).
 - Finding nodes requires traversal → O(n) in general.
 
+Array-Based Tree (class Tree):
+- Same tree, but nodes are integer ids into parallel arrays
+  (data, parent, first_child, next_sibling, level).
+- No object per node → less memory, no pointer chasing between objects.
+- find(data) looks nodes up in a dict index kept by add_child (O(1)).
+
 Time Complexity:
 | Operation      | Complexity |
 |----------------|------------|
-| add_child      | O(1)       |
-| get_level      | O(h)       | (h = height of node)
+| add_child      | O(k)       | (k = nodes in the attached subtree)
+| get_level      | O(1)       | (level cached by add_child)
 | print_tree     | O(n)       |
 =====================================
 """
 
+import sys
+from array import array
+
+NIL = -1  # "no node" marker in Tree's link arrays
+
+# Indent string per level, built once instead of " " * level * 4 per node
+_INDENTS = tuple(" " * (4 * level) for level in range(64))
+
+
+def _intern(value):
+    """Intern strings so that equal node values share one object"""
+    # Exact str only: sys.intern() rejects str subclasses
+    return sys.intern(value) if type(value) is str else value
+
 
 class TreeNode:
     """Class to represent a node in a tree"""
 
-    def __init__(self, data):
-        self.data = data
+    __slots__ = ("data", "parent", "children", "level")  # No per-node __dict__
+
+    def __init__(self, data, parent=None):
+        self.data = _intern(data)
         self.parent = None
         self.children = []
+        self.level = 0  # Depth below the root, kept up to date by add_child
+
+        # Attach right away when the parent is known (top-down building):
+        # the new node has no subtree yet, so its level is set in O(1)
+        if parent is not None:
+            parent.add_child(self)
 
     def add_child(self, child):
         """Add a child to this node"""
         child.parent = self
         self.children.append(child)
 
+        # Renumber the child's subtree: it may have been built before being
+        # attached (bottom-up), so its descendants need new levels too
+        child.level = self.level + 1
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            for grandchild in node.children:
+                grandchild.level = node.level + 1
+                stack.append(grandchild)
+
     def get_level(self):
-        """Return the depth level of the node"""
-        level = 0
-        parent = self.parent
-        while parent:
-            level += 1
-            parent = parent.parent
-        return level
+        """Return the depth level of the node (cached, O(1))"""
+        return self.level
+
+    def finalize(self):
+        """
+        Call once the tree is complete: turn every children list in this
+        subtree into a tuple (no over-allocated spare capacity).
+        add_child() can no longer be used on finalized nodes.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.children = tuple(node.children)
+            stack.extend(node.children)
 
     def print_tree(self):
-        """Recursively print the tree structure"""
-        indent = " " * self.get_level() * 4
-        prefix = "|__" if self.parent else ""
-        print(f"{indent}{prefix}{self.data}")
+        """Print the tree structure (depth-first, explicit stack, no recursion)"""
+        lines = []  # Collected, then written with one join instead of n prints
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            level = node.level
+            indent = _INDENTS[level] if level < len(_INDENTS) else " " * (4 * level)
+            prefix = "|__" if node.parent else ""
+            lines.append(f"{indent}{prefix}{node.data}")
+
+            stack.extend(reversed(node.children))  # Leftmost child on top
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+class Tree:
+    """
+    General tree stored as parallel arrays indexed by integer node id
+    ("Structure of Arrays"), instead of one TreeNode object per node.
+    Children are linked as first_child → next_sibling → ... → NIL.
+    """
+
+    def __init__(self, root_data):
+        self.data = [_intern(root_data)]  # Node values, indexed by node id
+        self.parent = array("i", [NIL])
+        self.first_child = array("i", [NIL])
+        self.last_child = array("i", [NIL])  # O(1) append of a new child
+        self.next_sibling = array("i", [NIL])
+        self.level = array("i", [0])
+        self._by_data = {}  # value → node ids, for find()
+        self._index_add(0)
 
-        for child in self.children:
-            child.print_tree()
+    def add_child(self, parent_id, data):
+        """Add a child under parent_id and return the new node id"""
+        node_id = len(self.data)
+        # Check before appending anything: a bad id must not leave the
+        # columns at different lengths (negative ids would also wrap around)
+        if not 0 <= parent_id < node_id:
+            raise ValueError(
+                f"parent {parent_id} is not a node (tree has {node_id} nodes)"
+            )
+        level = self.level[parent_id] + 1
+
+        self.data.append(_intern(data))
+        self.parent.append(parent_id)
+        self.first_child.append(NIL)
+        self.last_child.append(NIL)
+        self.next_sibling.append(NIL)
+        self.level.append(level)
+        self._index_add(node_id)
+
+        last = self.last_child[parent_id]
+        if last == NIL:  # First child of parent_id
+            self.first_child[parent_id] = node_id
+        else:
+            self.next_sibling[last] = node_id
+        self.last_child[parent_id] = node_id
+        return node_id
+
+    def _index_add(self, node_id):
+        """Record node_id under its value in the find() index"""
+        try:
+            self._by_data.setdefault(self.data[node_id], []).append(node_id)
+        except TypeError:  # Unhashable value → find() falls back to a scan
+            pass
+
+    def find(self, data):
+        """Return the ids of all nodes holding `data` (O(1) average, no walk)"""
+        try:
+            return list(self._by_data.get(data, ()))
+        except TypeError:  # Unhashable, never indexed → scan the values
+            return [i for i, value in enumerate(self.data) if value == data]
+
+    def get_level(self, node_id):
+        """Return the depth level of the node"""
+        return self.level[node_id]
+
+    def children(self, node_id):
+        """Yield the child ids of node_id in insertion order"""
+        next_sibling = self.next_sibling
+        child = self.first_child[node_id]
+        while child != NIL:
+            yield child
+            child = next_sibling[child]
+
+    def __len__(self):
+        return len(self.data)
+
+    def print_tree(self, node_id=0):
+        """Print the (sub)tree starting at node_id, depth-first"""
+        data, parent, level = self.data, self.parent, self.level
+        lines = []
+        stack = [node_id]
+        while stack:
+            i = stack.pop()
+            depth = level[i]
+            indent = _INDENTS[depth] if depth < len(_INDENTS) else " " * (4 * depth)
+            prefix = "|__" if parent[i] != NIL else ""
+            lines.append(f"{indent}{prefix}{data[i]}")
+
+            stack.extend(reversed(list(self.children(i))))  # Leftmost on top
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def build_product_tree():
@@ -74,30 +216,48 @@ def build_product_tree():
     root = TreeNode("Electronics")
 
     # Laptop subtree
-    laptop = TreeNode("Laptop")
-    laptop.add_child(TreeNode("Mac"))
-    laptop.add_child(TreeNode("Surface"))
-    laptop.add_child(TreeNode("Thinkpad"))
+    laptop = TreeNode("Laptop", parent=root)
+    TreeNode("Mac", parent=laptop)
+    TreeNode("Surface", parent=laptop)
+    TreeNode("Thinkpad", parent=laptop)
 
     # Cell Phone subtree
-    cellphone = TreeNode("Cell Phone")
-    cellphone.add_child(TreeNode("iPhone"))
-    cellphone.add_child(TreeNode("Google Pixel"))
-    cellphone.add_child(TreeNode("Vivo"))
+    cellphone = TreeNode("Cell Phone", parent=root)
+    TreeNode("iPhone", parent=cellphone)
+    TreeNode("Google Pixel", parent=cellphone)
+    TreeNode("Vivo", parent=cellphone)
 
     # TV subtree
-    tv = TreeNode("TV")
-    tv.add_child(TreeNode("Samsung"))
-    tv.add_child(TreeNode("LG"))
+    tv = TreeNode("TV", parent=root)
+    TreeNode("Samsung", parent=tv)
+    TreeNode("LG", parent=tv)
 
-    # Assemble the full tree
-    root.add_child(laptop)
-    root.add_child(cellphone)
-    root.add_child(tv)
+    # Construction is done → freeze the children lists
+    root.finalize()
 
     # Print the tree
     root.print_tree()
 
 
+def build_product_array_tree():
+    """Build and print the same product tree with the array-based Tree"""
+    tree = Tree("Electronics")
+
+    for category, products in (
+        ("Laptop", ("Mac", "Surface", "Thinkpad")),
+        ("Cell Phone", ("iPhone", "Google Pixel", "Vivo")),
+        ("TV", ("Samsung", "LG")),
+    ):
+        category_id = tree.add_child(0, category)
+        for product in products:
+            tree.add_child(category_id, product)
+
+    tree.print_tree()
+
+    mac_id = tree.find("Mac")[0]
+    print("Mac is at level", tree.get_level(mac_id))  # 2
+
+
 if __name__ == "__main__":
     build_product_tree()
+    build_product_array_tree()